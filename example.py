@@ -6,13 +6,49 @@ This example demonstrates how to use the IoTKit library for IoT simulation
 and communication.
 """
 
-from iotkit import Sensor, MQTTPublisher, HTTPPublisher, DataLogger
+from iotkit import Sensor, MQTTPublisher, HTTPPublisher, DataLogger, encode_json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 
 # Setup logging to see what's happening
 logging.basicConfig(level=logging.INFO)
 
+# Number of readings accumulated before a batched publish/log flush
+BATCH_SIZE = 16
+
+
+def flush_batch(batch, mqtt_pub, logger):
+    """Flush accumulated readings to MQTT and the data logger in one batch."""
+    if not batch:
+        return
+
+    if mqtt_pub:
+        try:
+            mqtt_pub.publish_batch(batch)
+            print(f"✓ Sent batch of {len(batch)} to MQTT")
+        except Exception as e:
+            print(f"✗ MQTT batch send failed: {e}")
+
+    try:
+        logger.log_batch(batch)
+        print(f"✓ Logged batch of {len(batch)} to file")
+    except Exception as e:
+        print(f"✗ Batch logging failed: {e}")
+
+    batch.clear()
+
+
+def send_http(http_pub, data):
+    """Encode one reading and send it via HTTP."""
+    try:
+        payload = encode_json(data)
+        http_pub.send_raw(payload)
+        print("✓ Sent via HTTP")
+    except Exception as e:
+        print(f"✗ HTTP send failed: {e}")
+
+
 def main():
     """Main example function."""
     print("=== IoTKit Example ===")
@@ -44,6 +80,11 @@ def main():
     print("\nStarting data collection and transmission...")
     print("Press Ctrl+C to stop")
     
+    batch = []
+    # One small pool for the whole run: the sinks are independent, so each
+    # iteration's fanout runs concurrently and costs max() of the sink
+    # latencies instead of their sum
+    executor = ThreadPoolExecutor(max_workers=3)
     try:
         # Connect to MQTT broker if available
         if mqtt_pub:
@@ -54,42 +95,47 @@ def main():
                 print(f"MQTT connection failed: {e}")
                 mqtt_pub = None
         
-        # Main loop
+        # Main loop: accumulate readings and flush them in batches.
+        # Absolute deadlines keep the cadence stable even when publishing
+        # is slow, instead of drifting by the per-iteration latency.
+        interval = 2.0
+        deadline = time.monotonic()
+        # Pre-generate all readings for the run in one batch call
+        values = sensor.read_batch(10)
         for i in range(10):  # Run for 10 iterations
-            # Read sensor data
-            data = sensor.to_dict()
+            deadline += interval
+            # Build the sample from the pre-generated reading
+            data = sensor.to_dict(values[i])
             print(f"\nIteration {i+1}: {data}")
-            
-            # Publish to MQTT
-            if mqtt_pub:
-                try:
-                    mqtt_pub.publish(data)
-                    print("✓ Sent to MQTT")
-                except Exception as e:
-                    print(f"✗ MQTT send failed: {e}")
-            
-            # Send via HTTP
+
+            # Fan out to the independent sinks concurrently
+            futures = []
+
+            # Snapshot the shared sample buffer: the batch outlives the
+            # next to_dict() call
+            batch.append(dict(data))
+            if len(batch) >= BATCH_SIZE:
+                futures.append(executor.submit(flush_batch, batch[:], mqtt_pub, logger))
+                batch.clear()
+
             if http_pub:
-                try:
-                    response = http_pub.send(data)
-                    print("✓ Sent via HTTP")
-                except Exception as e:
-                    print(f"✗ HTTP send failed: {e}")
-            
-            # Log to file
-            try:
-                logger.log(data)
-                print("✓ Logged to file")
-            except Exception as e:
-                print(f"✗ Logging failed: {e}")
-            
-            # Wait before next iteration
-            time.sleep(2)
-    
+                futures.append(executor.submit(send_http, http_pub, data))
+
+            if futures:
+                wait(futures, return_when=FIRST_EXCEPTION)
+
+            # Wait until the next absolute deadline
+            time.sleep(max(0.0, deadline - time.monotonic()))
+
     except KeyboardInterrupt:
         print("\nStopped by user")
-    
+
     finally:
+        # Flush any remaining readings before disconnecting
+        flush_batch(batch, mqtt_pub, logger)
+        executor.shutdown(wait=True)
+        logger.flush()
+
         # Cleanup
         if mqtt_pub and mqtt_pub.connected:
             mqtt_pub.disconnect()
@@ -128,26 +174,20 @@ def demo_multiple_sensors():
     
     from iotkit import SensorCollection
     
-    # Create sensor collection
-    collection = SensorCollection()
-    
-    # Add multiple sensors
+    # Build the collection from the configs in one pass
     sensors_config = [
         {"name": "temperature", "min_val": 18, "max_val": 35, "mode": "random"},
         {"name": "humidity", "min_val": 30, "max_val": 90, "mode": "random"},
         {"name": "pressure", "min_val": 990, "max_val": 1030, "mode": "random"},
     ]
-    
-    for config in sensors_config:
-        sensor = Sensor(**config)
-        collection.add_sensor(sensor)
-    
+    collection = SensorCollection.from_configs(sensors_config)
+
     print(f"Created collection with sensors: {collection.list_sensors()}")
     
-    # Read all sensors
-    all_data = collection.read_all()
-    for sensor_name, data in all_data.items():
-        print(f"{sensor_name}: {data}")
+    # Read all sensors in one columnar pass
+    names, values = collection.read_values()
+    for sensor_name, value in zip(names, values):
+        print(f"{sensor_name}: {value}")
 
 
 def demo_batch_logging():
@@ -197,12 +237,17 @@ def demo_mqtt_subscriber():
 
 
 if __name__ == "__main__":
-    main()
-    
-    # Run additional demos
-    demo_manual_sensor()
-    demo_multiple_sensors()
-    demo_batch_logging()
+    # The demos are I/O independent and write to distinct files, so run
+    # them in parallel: total wall time becomes the slowest demo instead
+    # of the sum of all of them
+    with ThreadPoolExecutor(max_workers=4) as demo_pool:
+        demo_futures = [
+            demo_pool.submit(f)
+            for f in (main, demo_manual_sensor, demo_multiple_sensors, demo_batch_logging)
+        ]
+        wait(demo_futures)
+
+    # Informational only, keep it sequential
     demo_mqtt_subscriber()
     
     print("\n=== Example completed ===")
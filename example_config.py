@@ -5,7 +5,8 @@ IoTKit Configuration Example
 This example demonstrates how to use configuration files with IoTKit library.
 """
 
-from iotkit import ConfigManager, Sensor, MQTTPublisher, HTTPPublisher, DataLogger
+from iotkit import ConfigManager, Sensor, MQTTPublisher, HTTPPublisher, DataLogger, encode_json
+import os
 import time
 import logging
 
@@ -27,36 +28,36 @@ def main():
             print("✗ No config file found, using default configuration")
             config = ConfigManager()
     
-    # 2. Display loaded configuration
+    # 2. Display loaded configuration (frozen view: attribute access
+    # instead of a dotted-key dict walk per lookup)
     print("\n2. Current Configuration:")
-    print("MQTT Broker:", config.get("mqtt.broker"))
-    print("MQTT Port:", config.get("mqtt.port"))
-    print("HTTP Base URL:", config.get("http.base_url"))
-    print("Sensor Default Mode:", config.get("sensors.default_mode"))
-    print("Log Level:", config.get("logging.log_level"))
+    cfg = config.freeze()
+    print("MQTT Broker:", cfg.mqtt.broker)
+    print("MQTT Port:", cfg.mqtt.port)
+    print("HTTP Base URL:", cfg.http.base_url)
+    print("Sensor Default Mode:", cfg.sensors.default_mode)
+    print("Log Level:", cfg.logging.log_level)
     
     # 3. Create sensors using configuration
     print("\n3. Creating sensors using configuration...")
     
+    # Hoist the config lookups into locals instead of re-walking the
+    # dotted keys for every use
+    default_mode = config.get("sensors.default_mode", "random")
+
     # Temperature sensor from config
     temp_config = config.get("sensors.temperature", {})
-    temp_sensor = Sensor(
-        "temperature",
-        min_val=temp_config.get("min_val", 20),
-        max_val=temp_config.get("max_val", 30),
-        mode=config.get("sensors.default_mode", "random")
-    )
-    print(f"✓ Temperature sensor created: {temp_config.get('min_val', 20)}-{temp_config.get('max_val', 30)}°C")
-    
+    temp_min = temp_config.get("min_val", 20)
+    temp_max = temp_config.get("max_val", 30)
+    temp_sensor = Sensor("temperature", min_val=temp_min, max_val=temp_max, mode=default_mode)
+    print(f"✓ Temperature sensor created: {temp_min}-{temp_max}°C")
+
     # Humidity sensor from config
     humidity_config = config.get("sensors.humidity", {})
-    humidity_sensor = Sensor(
-        "humidity",
-        min_val=humidity_config.get("min_val", 40),
-        max_val=humidity_config.get("max_val", 80),
-        mode=config.get("sensors.default_mode", "random")
-    )
-    print(f"✓ Humidity sensor created: {humidity_config.get('min_val', 40)}-{humidity_config.get('max_val', 80)}%")
+    humidity_min = humidity_config.get("min_val", 40)
+    humidity_max = humidity_config.get("max_val", 80)
+    humidity_sensor = Sensor("humidity", min_val=humidity_min, max_val=humidity_max, mode=default_mode)
+    print(f"✓ Humidity sensor created: {humidity_min}-{humidity_max}%")
     
     # 4. Create communication components using configuration
     print("\n4. Setting up communication...")
@@ -93,8 +94,9 @@ def main():
     log_format = logging_config.get("file_format", "csv")
     log_dir = logging_config.get("log_directory", "logs")
     
-    import os
-    os.makedirs(log_dir, exist_ok=True)
+    # Only touch the filesystem when the directory is actually missing
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir)
     
     logger = DataLogger(f"{log_dir}/sensor_data_config.{log_format}", format_type=log_format)
     print(f"✓ Data Logger created: {log_dir}/sensor_data_config.{log_format}")
@@ -135,41 +137,65 @@ def main():
     print("Collecting 5 samples...")
     
     reading_interval = config.get("sensors.reading_interval", 2.0)
-    
-    for i in range(5):
-        # Read sensor data
-        temp_data = temp_sensor.to_dict()
-        humidity_data = humidity_sensor.to_dict()
-        
-        print(f"\nSample {i+1}:")
-        print(f"  Temperature: {temp_data['value']}°C")
-        print(f"  Humidity: {humidity_data['value']}%")
-        
-        # Log data
-        logger.log(temp_data)
-        logger.log(humidity_data)
-        
-        # Send via MQTT if available
-        if mqtt_pub:
-            try:
-                mqtt_pub.connect()
-                mqtt_pub.publish(temp_data)
-                mqtt_pub.publish(humidity_data)
-                print("  ✓ Data sent via MQTT")
-            except Exception as e:
-                print(f"  ✗ MQTT send failed: {e}")
-        
-        # Send via HTTP if available
-        if http_pub:
-            try:
-                http_pub.send(temp_data)
-                http_pub.send(humidity_data)
-                print("  ✓ Data sent via HTTP")
-            except Exception as e:
-                print(f"  ✗ HTTP send failed: {e}")
-        
-        if i < 4:  # Don't sleep after last iteration
-            time.sleep(reading_interval)
+
+    # Connect once and publish on the open session; reconnecting per sample
+    # would pay a TCP + MQTT CONNECT handshake for every reading.
+    if mqtt_pub:
+        try:
+            mqtt_pub.connect()
+            print("✓ Connected to MQTT broker")
+        except Exception as e:
+            print(f"✗ MQTT connection failed: {e}")
+            mqtt_pub = None
+
+    try:
+        # Absolute deadlines keep the sampling cadence stable even when
+        # publish/log latency varies, instead of drifting per iteration.
+        deadline = time.monotonic()
+        for i in range(5):
+            deadline += reading_interval
+            # Read sensor data
+            temp_data = temp_sensor.to_dict()
+            humidity_data = humidity_sensor.to_dict()
+
+            print(f"\nSample {i+1}:")
+            print(f"  Temperature: {temp_data['value']}°C")
+            print(f"  Humidity: {humidity_data['value']}%")
+
+            # Encode each reading once and share the payload across sinks
+            temp_payload = encode_json(temp_data)
+            humidity_payload = encode_json(humidity_data)
+
+            # Log data
+            logger.log_raw(temp_data, temp_payload)
+            logger.log_raw(humidity_data, humidity_payload)
+
+            # Send via MQTT if available (async confirm: acks are
+            # reconciled off the critical path by the network thread)
+            if mqtt_pub:
+                try:
+                    mqtt_pub.publish_raw(temp_payload)
+                    mqtt_pub.publish_raw(humidity_payload)
+                    print("  ✓ Data sent via MQTT")
+                except Exception as e:
+                    print(f"  ✗ MQTT send failed: {e}")
+
+            # Send via HTTP if available
+            if http_pub:
+                try:
+                    http_pub.send_raw(temp_payload)
+                    http_pub.send_raw(humidity_payload)
+                    print("  ✓ Data sent via HTTP")
+                except Exception as e:
+                    print(f"  ✗ HTTP send failed: {e}")
+
+            if i < 4:  # Don't sleep after last iteration
+                time.sleep(max(0.0, deadline - time.monotonic()))
+    finally:
+        if mqtt_pub and mqtt_pub.connected:
+            mqtt_pub.wait_for_acks()
+            mqtt_pub.disconnect()
+            print("\n✓ Disconnected from MQTT broker")
     
     # 10. Display configuration summary
     print("\n9. Configuration Summary:")
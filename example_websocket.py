@@ -17,6 +17,10 @@ from iotkit import (
 # Setup logging to see what's happening
 logging.basicConfig(level=logging.INFO)
 
+# Signaled to end a server demo early (e.g. on client disconnect) instead
+# of blocking the main thread for the full demo duration
+stop_event = threading.Event()
+
 def basic_websocket_publisher_example():
     """Basic WebSocket publisher example."""
     print("=== WebSocket Publisher Example ===")
@@ -38,18 +42,11 @@ def basic_websocket_publisher_example():
         
         if ws_publisher.is_connected():
             print("✓ Connected to WebSocket server")
-            
-            # Send sensor data
-            for i in range(5):
-                data = sensor.to_dict()
-                success = ws_publisher.send(data)
-                
-                if success:
-                    print(f"✓ Sent data: {data['value']}°C")
-                else:
-                    print("✗ Failed to send data")
-                
-                time.sleep(2)
+
+            # Batch the readings and send them with one thread→loop handoff
+            batch = [sensor.to_dict() for _ in range(5)]
+            sent = ws_publisher.send_many(batch)
+            print(f"✓ Sent {sent}/{len(batch)} readings")
         else:
             print("✗ Failed to connect to WebSocket server")
     
@@ -85,6 +82,8 @@ def basic_websocket_server_example():
     def on_client_disconnect(websocket, client_address):
         """Handle client disconnections."""
         print(f"✗ Client disconnected: {client_address}")
+        # Let the demo finish as soon as the client is gone
+        stop_event.set()
     
     # Create WebSocket server
     ws_server = WebSocketServer(
@@ -101,9 +100,11 @@ def basic_websocket_server_example():
         print("✓ WebSocket server started on localhost:8765")
         print("You can connect to it using: ws://localhost:8765")
         
-        # Keep server running for demonstration
-        print("Server running for 30 seconds...")
-        time.sleep(30)
+        # Keep server running for demonstration; a client disconnect
+        # (or any stop_event.set()) ends the demo immediately
+        print("Server running for up to 30 seconds...")
+        stop_event.clear()
+        stop_event.wait(timeout=30)
         
     except Exception as e:
         print(f"Server error: {e}")
@@ -129,10 +130,11 @@ def websocket_bridge_example():
         # bridge.add_publisher("external_api", "ws://external-api.example.com/websocket")
         # bridge.add_subscriber("data_feed", "ws://data-feed.example.com/stream")
         
-        print("Bridge running for 20 seconds...")
+        print("Bridge running for up to 20 seconds...")
         print("Connect clients to: ws://localhost:8766")
-        
+
         # Simulate sending data through bridge
+        stop_event.clear()
         for i in range(3):
             test_data = {
                 "sensor": "bridge_test",
@@ -141,7 +143,8 @@ def websocket_bridge_example():
             }
             bridge.server.broadcast(test_data)
             print(f"✓ Broadcasted test data: {test_data}")
-            time.sleep(5)
+            if stop_event.wait(timeout=5):
+                break
         
         # Show bridge status
         status = bridge.get_status()
@@ -180,14 +183,18 @@ def sensor_data_streaming_example():
     
     def data_streaming_loop():
         """Continuous data streaming loop."""
-        while True:
+        # Read the wall clock once; per-packet timestamps are derived
+        # from the monotonic clock, saving a gettimeofday per packet
+        base_ns = time.time_ns()
+        base_mono = time.monotonic_ns()
+        while not stop_event.is_set():
             try:
                 # Read all sensors
                 all_data = sensors.read_all()
-                
+
                 # Create streaming packet
                 stream_data = {
-                    "timestamp": time.time(),
+                    "timestamp": (base_ns + time.monotonic_ns() - base_mono) / 1e9,
                     "device_id": "iotkit_demo_device",
                     "sensors": all_data
                 }
@@ -199,9 +206,10 @@ def sensor_data_streaming_example():
                 ws_server.broadcast(stream_data)
                 
                 print(f"✓ Streamed sensor data to {ws_server.get_connected_clients_count()} clients")
-                
-                time.sleep(3)  # Stream every 3 seconds
-                
+
+                if stop_event.wait(timeout=3):  # Stream every 3 seconds
+                    break
+
             except Exception as e:
                 print(f"Streaming error: {e}")
                 break
@@ -210,19 +218,21 @@ def sensor_data_streaming_example():
         # Start WebSocket server
         ws_server.start()
         print("✓ Sensor streaming server started on localhost:8767")
-        
+
         # Start data streaming in background thread
+        stop_event.clear()
         stream_thread = threading.Thread(target=data_streaming_loop, daemon=True)
         stream_thread.start()
-        
-        print("Streaming sensor data for 25 seconds...")
+
+        print("Streaming sensor data for up to 25 seconds...")
         print("Connect to: ws://localhost:8767")
-        time.sleep(25)
-        
+        stop_event.wait(timeout=25)
+
     except Exception as e:
         print(f"Streaming error: {e}")
-    
+
     finally:
+        stop_event.set()
         ws_server.stop()
         print("✓ Sensor streaming stopped")
 
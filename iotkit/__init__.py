@@ -36,7 +36,7 @@ from .utils import (
 )
 
 # Define what gets imported with "from iotkit import *"
-__all__ = [
+__all__ = (
     # Core classes
     'Sensor',
     'SensorCollection',
@@ -73,7 +73,14 @@ __all__ = [
     '__version__',
     '__author__',
     '__license__'
-]
+)
+
+# Use uvloop for the asyncio event loops when available
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Setup default logging
 import logging
@@ -93,5 +100,5 @@ def get_info():
         'description': 'A comprehensive IoT simulation and communication library'
     }
 
-# Initialize library
-logger.info(f"IoTKit v{__version__} initialized")
\ No newline at end of file
+# Initialize library (lazy formatting: no string is built if INFO is off)
+logger.info("IoTKit v%s initialized", __version__)
\ No newline at end of file
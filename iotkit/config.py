@@ -4,16 +4,128 @@ IoTKit Configuration Module
 This module provides configuration management from YAML/JSON files.
 """
 
+import copy
 import json
+import mmap
 import os
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Dict, Any, Optional, Union
-from pathlib import Path
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+if yaml is not None:
+    try:
+        # libyaml-backed loader: moves the tokenize/parse loop into C
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this size the mmap setup costs more than the copy it saves
+_MMAP_THRESHOLD = 4096
+
+# Sentinel distinguishing "key absent" from "key set to None" in diffs
+_MISSING = object()
+
+
+def _file_ext(path: str) -> str:
+    """Lowercased extension of path without building a Path object."""
+    base, sep, ext = os.path.basename(path).rpartition('.')
+    return '.' + ext.lower() if sep else ''
+
+# Default configuration template, built once at import; instances take
+# deep copies so the template itself is never mutated
+_DEFAULT_CONFIG = {
+    "mqtt": {
+        "broker": "mqtt.eclipseprojects.io",
+        "port": 1883,
+        "topic_prefix": "iotkit",
+        "username": None,
+        "password": None,
+        "client_id_prefix": "iotkit_client"
+    },
+    "http": {
+        "base_url": "http://localhost:5000/api",
+        "timeout": 30,
+        "headers": {
+            "Content-Type": "application/json"
+        },
+        "auth_token": None
+    },
+    "sensors": {
+        "default_mode": "random",
+        "reading_interval": 2.0,
+        "precision": 2
+    },
+    "logging": {
+        "log_level": "INFO",
+        "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "file_format": "csv",
+        "auto_timestamp": True
+    },
+    "general": {
+        "device_id_prefix": "iotkit_device",
+        "data_retention_days": 30,
+        "batch_size": 10
+    }
+}
+
+# Template serialized once at import: rehydrating a known JSON blob in
+# orjson's C decoder beats deepcopy's recursive Python traversal
+_DEFAULT_JSON = orjson.dumps(_DEFAULT_CONFIG) if orjson is not None else None
+
+
+def _default_config_copy() -> Dict[str, Any]:
+    """Fresh, unaliased copy of the default configuration tree."""
+    if orjson is not None:
+        return orjson.loads(_DEFAULT_JSON)
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+
+@lru_cache(maxsize=128)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a configuration file, caching the result by (path, mtime, size).
+
+    Repeated loads of an unchanged file (test suites, CLI invocations,
+    per-request reloads) skip the read and the YAML/JSON tokenizer
+    entirely; any modification changes mtime/size and misses the cache.
+    Callers must copy the returned dict before mutating it.
+    """
+    file_ext = _file_ext(path)
+
+    if file_ext == '.json':
+        if size >= _MMAP_THRESHOLD:
+            # Map the page cache straight into the process and hand the
+            # buffer to the parser, skipping the userspace read copy
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if orjson is not None:
+                    return orjson.loads(memoryview(mm))
+                return json.loads(mm[:])
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    elif file_ext in ['.yml', '.yaml']:
+        if yaml is None:
+            raise ImportError("PyYAML is required for YAML support. Install with: pip install PyYAML")
+        if size >= _MMAP_THRESHOLD:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_YamlLoader)
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=_YamlLoader)
+    else:
+        raise ValueError(f"Unsupported file format: {file_ext}. Use .json, .yml, or .yaml")
+
 
 class ConfigManager:
     """
@@ -21,59 +133,36 @@ class ConfigManager:
     
     Supports loading configuration from YAML and JSON files.
     """
-    
+
+    __slots__ = ('config_file', 'config', 'default_config', '_flat', '_dirty',
+                 '_last_parsed', '_watchers')
+
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration manager.
-        
+
         Args:
             config_file (str, optional): Path to configuration file
         """
         self.config_file = config_file
         self.config = {}
+        self._flat = {}
+        self._dirty = True
+        self._last_parsed = None
+        self._watchers = {}
         self.default_config = self._get_default_config()
-        
+
         if config_file:
             self.load_config(config_file)
         else:
-            self.config = self.default_config.copy()
-    
+            # Unaliased copy: a shallow copy would let set() mutate the
+            # shared nested defaults
+            self.config = _default_config_copy()
+            self._rebuild_flat()
+
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
-        return {
-            "mqtt": {
-                "broker": "mqtt.eclipseprojects.io",
-                "port": 1883,
-                "topic_prefix": "iotkit",
-                "username": None,
-                "password": None,
-                "client_id_prefix": "iotkit_client"
-            },
-            "http": {
-                "base_url": "http://localhost:5000/api",
-                "timeout": 30,
-                "headers": {
-                    "Content-Type": "application/json"
-                },
-                "auth_token": None
-            },
-            "sensors": {
-                "default_mode": "random",
-                "reading_interval": 2.0,
-                "precision": 2
-            },
-            "logging": {
-                "log_level": "INFO",
-                "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                "file_format": "csv",
-                "auto_timestamp": True
-            },
-            "general": {
-                "device_id_prefix": "iotkit_device",
-                "data_retention_days": 30,
-                "batch_size": 10
-            }
-        }
+        return _default_config_copy()
     
     def load_config(self, config_file: str) -> None:
         """
@@ -86,31 +175,164 @@ class ConfigManager:
             FileNotFoundError: If config file doesn't exist
             ValueError: If file format is not supported
         """
-        if not os.path.exists(config_file):
+        # One stat doubles as the existence check and supplies the
+        # cache key, instead of a separate exists() syscall
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
-        
-        file_ext = Path(config_file).suffix.lower()
-        
+
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                if file_ext == '.json':
-                    loaded_config = json.load(f)
-                elif file_ext in ['.yml', '.yaml']:
-                    if yaml is None:
-                        raise ImportError("PyYAML is required for YAML support. Install with: pip install PyYAML")
-                    loaded_config = yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {file_ext}. Use .json, .yml, or .yaml")
-            
+            # Reuse the parsed dict while the file is unchanged; deepcopy
+            # so cached state is never aliased into self.config
+            loaded_config = copy.deepcopy(
+                _parse_cached(os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+            )
+
             # Merge with default config
             self.config = self._deep_merge(self.default_config, loaded_config)
             self.config_file = config_file
-            
+            self._last_parsed = loaded_config
+            self._dirty = True
+            self._rebuild_flat()
+
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in config file: {e}")
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in config file: {e}")
     
+    def watch(self, prefix: str, callback) -> None:
+        """
+        Register a callback for changes under a dotted-key prefix.
+
+        Callbacks fire from reload_incremental with the list of
+        (key, old, new) changes that fall under their prefix, so a
+        watcher of 'sensors' is not invoked when only 'mqtt.broker'
+        changed.
+
+        Args:
+            prefix (str): Dotted-key prefix to watch (e.g., 'sensors')
+            callback (callable): Called with a list of (key, old, new)
+        """
+        self._watchers.setdefault(prefix, []).append(callback)
+
+    def reload_incremental(self) -> list:
+        """
+        Reload the config file, applying only the keys that changed.
+
+        Reparses the file and diffs it against the previously parsed
+        tree, then patches just the changed leaves into the config and
+        flat index instead of rebuilding the full merged dict — most
+        runtime config edits touch one or two keys. Keys removed from
+        the file revert to their default value when one exists, as a
+        full load_config would; keys without a default are removed.
+
+        Returns:
+            list: (dotted_key, old_value, new_value) tuples that changed
+
+        Raises:
+            ValueError: If no config file has been loaded
+            FileNotFoundError: If the config file no longer exists
+        """
+        if not self.config_file:
+            raise ValueError("No config file loaded")
+
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
+        new_parsed = copy.deepcopy(
+            _parse_cached(os.path.abspath(self.config_file), st.st_mtime_ns, st.st_size)
+        )
+
+        changes = []
+        self._diff_trees(self._last_parsed or {}, new_parsed, "", changes)
+
+        result = []
+        for key, old, new in changes:
+            old_val = None if old is _MISSING else old
+            if new is _MISSING:
+                # Key removed from the file: revert to the default
+                # value when one exists, matching what a full
+                # load_config merge would produce
+                default_val = self._default_for(key)
+                if default_val is not _MISSING:
+                    if default_val == old:
+                        # The file value matched the default; nothing
+                        # actually changes
+                        continue
+                    self.set(key, default_val)
+                    result.append((key, old_val, default_val))
+                    continue
+                # No default: drop the key from the merged config and
+                # the flat index, pruning parent dicts left empty
+                # unless the defaults define them
+                keys = key.split('.')
+                node = self.config
+                parents = []
+                try:
+                    for k in keys[:-1]:
+                        parents.append((node, k))
+                        node = node[k]
+                    node.pop(keys[-1], None)
+                except (KeyError, TypeError):
+                    pass
+                for i in range(len(parents) - 1, -1, -1):
+                    parent, k = parents[i]
+                    if parent.get(k) != {}:
+                        break
+                    if self._default_for('.'.join(keys[:i + 1])) is not _MISSING:
+                        break
+                    parent.pop(k, None)
+                self._flat.pop(key, None)
+                self._dirty = True
+                result.append((key, old_val, None))
+            else:
+                self.set(key, new)
+                result.append((key, old_val, new))
+
+        self._last_parsed = new_parsed
+
+        if result:
+            for prefix, callbacks in self._watchers.items():
+                dotted = prefix + '.'
+                relevant = [c for c in result if c[0] == prefix or c[0].startswith(dotted)]
+                if relevant:
+                    for callback in callbacks:
+                        callback(relevant)
+
+        return result
+
+    def _default_for(self, key: str) -> Any:
+        """Value for a dotted key in default_config, or _MISSING."""
+        node = self.default_config
+        for k in key.split('.'):
+            if not isinstance(node, dict) or k not in node:
+                return _MISSING
+            node = node[k]
+        return node
+
+    @staticmethod
+    def _diff_trees(old: Dict, new: Dict, prefix: str, changes: list) -> None:
+        """Collect leaf-level differences between two parsed trees."""
+        for k, v in new.items():
+            path = f"{prefix}.{k}" if prefix else k
+            ov = old.get(k, _MISSING) if isinstance(old, dict) else _MISSING
+            if isinstance(v, dict) and isinstance(ov, dict):
+                ConfigManager._diff_trees(ov, v, path, changes)
+            elif isinstance(v, dict) and ov is _MISSING:
+                ConfigManager._diff_trees({}, v, path, changes)
+            elif ov is _MISSING or ov != v:
+                changes.append((path, ov, v))
+        if isinstance(old, dict):
+            for k, v in old.items():
+                if k not in new:
+                    path = f"{prefix}.{k}" if prefix else k
+                    if isinstance(v, dict):
+                        ConfigManager._diff_trees(v, {}, path, changes)
+                    else:
+                        changes.append((path, v, _MISSING))
+
     def save_config(self, config_file: Optional[str] = None) -> None:
         """
         Save current configuration to file.
@@ -125,35 +347,65 @@ class ConfigManager:
         if not file_path:
             raise ValueError("No config file specified")
         
-        file_ext = Path(file_path).suffix.lower()
-        
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        file_ext = _file_ext(file_path)
+
+        # Create directory if it doesn't exist; bare filenames have no
+        # directory component to create
+        dir_name = os.path.dirname(file_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            if file_ext == '.json':
-                json.dump(self.config, f, indent=2)
-            elif file_ext in ['.yml', '.yaml']:
-                if yaml is None:
-                    raise ImportError("PyYAML is required for YAML support. Install with: pip install PyYAML")
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+        if file_ext == '.json':
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
             else:
-                raise ValueError(f"Unsupported file format: {file_ext}")
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2)
+        elif file_ext in ['.yml', '.yaml']:
+            if yaml is None:
+                raise ImportError("PyYAML is required for YAML support. Install with: pip install PyYAML")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+        else:
+            raise ValueError(f"Unsupported file format: {file_ext}")
     
+    def _rebuild_flat(self) -> None:
+        """Rebuild the flat dotted-key index used by get()."""
+        flat = {}
+
+        def walk(node, prefix):
+            for k, v in node.items():
+                path = f"{prefix}.{k}" if prefix else k
+                if isinstance(v, dict):
+                    walk(v, path)
+                else:
+                    flat[path] = v
+
+        walk(self.config, "")
+        self._flat = flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
-        
+
+        Leaf values resolve with a single dict lookup against a flat
+        dotted-key index maintained at load/set time; keys that address
+        whole sub-dicts fall back to walking the nested config.
+
         Args:
             key (str): Configuration key (e.g., 'mqtt.broker')
             default: Default value if key not found
-        
+
         Returns:
             Configuration value or default
         """
+        if key in self._flat:
+            return self._flat[key]
+
         keys = key.split('.')
         value = self.config
-        
+
         try:
             for k in keys:
                 value = value[k]
@@ -180,7 +432,45 @@ class ConfigManager:
         
         # Set the value
         config[keys[-1]] = value
+        self._dirty = True
+
+        # Refresh only the affected branch of the flat index
+        prefix = key + '.'
+        for stale in [k for k in self._flat if k == key or k.startswith(prefix)]:
+            del self._flat[stale]
+        if isinstance(value, dict):
+            def walk(node, pre):
+                for k, v in node.items():
+                    path = f"{pre}.{k}"
+                    if isinstance(v, dict):
+                        walk(v, path)
+                    else:
+                        self._flat[path] = v
+
+            walk(value, key)
+        else:
+            self._flat[key] = value
     
+    def freeze(self) -> SimpleNamespace:
+        """
+        Compile the current configuration into a namespace tree.
+
+        get() splits the dotted key and walks nested dicts on every call;
+        for configuration that is read-only after load, attribute access
+        on the frozen view (e.g. cfg.mqtt.broker) replaces that with a
+        single C-level lookup. The view is a snapshot: later set() or
+        load_config() calls are not reflected in it.
+
+        Returns:
+            SimpleNamespace: Nested namespace mirroring the config dicts
+        """
+        def build(node):
+            if isinstance(node, dict):
+                return SimpleNamespace(**{k: build(v) for k, v in node.items()})
+            return node
+
+        return build(self.config)
+
     def get_mqtt_config(self) -> Dict[str, Any]:
         """Get MQTT configuration."""
         return self.config.get('mqtt', {})
@@ -208,32 +498,51 @@ class ConfigManager:
         Returns:
             dict: Merged dictionary
         """
-        result = base.copy()
-        
-        for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        
+        # One deepcopy up front, then an explicit work-stack mutating it
+        # in place: no per-level dict copies and no recursive calls
+        result = copy.deepcopy(base)
+        stack = [(result, update)]
+
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
+
         return result
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached parsed configuration files."""
+        _parse_cached.cache_clear()
+
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self.config = self.default_config.copy()
+        self.config = _default_config_copy()
+        self._dirty = True
+        self._rebuild_flat()
     
     def validate_config(self) -> bool:
         """
         Validate current configuration.
-        
+
+        The result is cached: repeated calls are a flag check until
+        set(), load_config(), or reset_to_defaults() marks the
+        configuration dirty again.
+
         Returns:
             bool: True if configuration is valid
-        
+
         Raises:
             ValueError: If configuration is invalid
         """
+        if not self._dirty:
+            return True
+
         # Validate MQTT config
-        mqtt_config = self.get_mqtt_config()
+        mqtt_config = self.config.get('mqtt', {})
         if not mqtt_config.get('broker'):
             raise ValueError("MQTT broker is required")
         
@@ -241,15 +550,18 @@ class ConfigManager:
             raise ValueError("MQTT port must be an integer")
         
         # Validate HTTP config
-        http_config = self.get_http_config()
+        http_config = self.config.get('http', {})
         if not http_config.get('base_url'):
             raise ValueError("HTTP base_url is required")
-        
+
         # Validate sensor config
-        sensor_config = self.get_sensor_config()
+        sensor_config = self.config.get('sensors', {})
         if sensor_config.get('default_mode') not in ['random', 'manual']:
             raise ValueError("Sensor default_mode must be 'random' or 'manual'")
-        
+
+        # Only a passing run is cached; a failing one raises above and
+        # stays dirty so the next call re-checks
+        self._dirty = False
         return True
     
     def __str__(self) -> str:
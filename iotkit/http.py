@@ -4,13 +4,43 @@ IoTKit HTTP Module
 This module provides HTTP client functionality for sending IoT data via REST API.
 """
 
+import asyncio
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .utils import validate_data
 
+# Response bodies above this size are parsed incrementally off the
+# socket instead of being buffered whole first
+_STREAM_THRESHOLD = 64 * 1024
+
+if orjson is not None:
+    # orjson returns bytes directly, skipping the encode step
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 
 class HTTPPublisher:
     """
@@ -30,7 +60,7 @@ class HTTPPublisher:
         """
         self.url = url
         self.timeout = timeout
-        self.logger = logging.getLogger(f"iotkit.http.publisher.{url}")
+        self.logger = logging.getLogger("iotkit.http.publisher")
         
         # Set default headers
         self.headers = {
@@ -45,8 +75,45 @@ class HTTPPublisher:
         # Add authentication header if token provided
         if auth_token:
             self.headers['Authorization'] = f'Bearer {auth_token}'
+
+        # Live read-only view handed out by get_headers(); mutators
+        # update self.headers in place so the view stays current
+        self._headers_view = MappingProxyType(self.headers)
+
+        # Pooled session with keep-alive so repeated sends reuse the same
+        # TCP (and TLS) connection instead of handshaking per request;
+        # transient gateway errors are retried with backoff
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers.update(self.headers)
+
+        # Async client is created lazily on first send_async call
+        self._aclient = None
+
+        # Endpoint → full URL cache; steady-state callers hit the same
+        # handful of endpoints, so the rstrip/lstrip/format runs once
+        self._base_url = self.url.rstrip('/')
+        self._url_cache = {None: self.url}
     
-    def send(self, data: Dict[str, Any], method: str = 'POST', 
+    def _target_url(self, endpoint: Optional[str]) -> str:
+        """Resolve and cache the full URL for an endpoint path."""
+        target_url = self._url_cache.get(endpoint)
+        if target_url is None:
+            target_url = f"{self._base_url}/{endpoint.lstrip('/')}"
+            if len(self._url_cache) >= 256:
+                # Drop the oldest entry so pathological callers with
+                # unbounded endpoint sets cannot grow the cache forever
+                del self._url_cache[next(iter(self._url_cache))]
+            self._url_cache[endpoint] = target_url
+        return target_url
+
+    def send(self, data: Dict[str, Any], method: str = 'POST',
              endpoint: Optional[str] = None) -> Dict[str, Any]:
         """
         Send data to HTTP endpoint.
@@ -68,79 +135,284 @@ class HTTPPublisher:
             validated_data = validate_data(data)
             
             # Prepare URL
-            target_url = self.url
-            if endpoint:
-                target_url = f"{self.url.rstrip('/')}/{endpoint.lstrip('/')}"
+            target_url = self._target_url(endpoint)
+
+            # Serialize once here (orjson's C encoder when available)
+            # instead of letting requests re-encode the dict internally
+            if orjson is not None:
+                body = orjson.dumps(validated_data, default=str)
+            else:
+                body = json.dumps(validated_data, ensure_ascii=False, default=str).encode('utf-8')
+
+            # Send request over the pooled session; stream=True defers
+            # the body download so large responses can be parsed
+            # incrementally below
+            response = self._session.request(
+                method=method.upper(),
+                url=target_url,
+                data=body,
+                timeout=self.timeout,
+                stream=True
+            )
+
+            try:
+                # Prepare response data
+                response_data = {
+                    'status_code': response.status_code,
+                    'success': response.ok,
+                    'url': target_url,
+                    'method': method.upper(),
+                    'data_sent': validated_data
+                }
+
+                # Add response content if available
+                content_length = int(response.headers.get('Content-Length', 0))
+                if ijson is not None and content_length > _STREAM_THRESHOLD:
+                    # Parse straight off the socket: reading and parsing
+                    # overlap and peak memory is bounded by parser state
+                    # rather than the body size
+                    response.raw.decode_content = True
+                    try:
+                        response_data['response'] = next(ijson.items(response.raw, ''), None)
+                    except ijson.JSONError:
+                        response_data['response'] = response.text
+                else:
+                    try:
+                        if response.content:
+                            response_data['response'] = response.json()
+                    except json.JSONDecodeError:
+                        response_data['response'] = response.text
+
+                # Log the request
+                if response.ok:
+                    self.logger.info("Successfully sent data to %s", target_url)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Response: %s", response_data)
+                else:
+                    self.logger.warning("Request failed with status %s", response.status_code)
+                    response.raise_for_status()
+
+                return response_data
+            finally:
+                response.close()
             
-            # Send request
-            response = requests.request(
+        except requests.exceptions.RequestException as e:
+            self.logger.error("HTTP request failed: %s", e)
+            raise ConnectionError(f"Failed to send data to {target_url}: {str(e)}")
+        except Exception as e:
+            self.logger.error("Unexpected error: %s", e)
+            raise ValueError(f"Failed to send data: {str(e)}")
+    
+    def send_raw(self, payload: str, method: str = 'POST',
+                 endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send a pre-encoded JSON payload to the HTTP endpoint.
+
+        Skips validation and re-serialization; the caller encodes the data
+        once (see iotkit.utils.encode_json) and shares the payload across
+        sinks.
+
+        Args:
+            payload (str): Pre-encoded JSON payload
+            method (str): HTTP method (default: POST)
+            endpoint (str, optional): Additional endpoint path
+
+        Returns:
+            dict: Response data with status and content
+
+        Raises:
+            ConnectionError: If request fails
+        """
+        # Prepare URL
+        target_url = self._target_url(endpoint)
+
+        try:
+            # Send raw body; Content-Type is already application/json
+            response = self._session.request(
                 method=method.upper(),
                 url=target_url,
-                json=validated_data,
-                headers=self.headers,
+                data=payload,
                 timeout=self.timeout
             )
-            
+
             # Prepare response data
             response_data = {
                 'status_code': response.status_code,
                 'success': response.ok,
                 'url': target_url,
-                'method': method.upper(),
-                'data_sent': validated_data
+                'method': method.upper()
             }
-            
+
             # Add response content if available
             try:
                 if response.content:
                     response_data['response'] = response.json()
             except json.JSONDecodeError:
                 response_data['response'] = response.text
-            
+
             # Log the request
             if response.ok:
-                self.logger.info(f"Successfully sent data to {target_url}")
-                self.logger.debug(f"Response: {response_data}")
+                self.logger.info("Successfully sent data to %s", target_url)
             else:
-                self.logger.warning(f"Request failed with status {response.status_code}")
+                self.logger.warning("Request failed with status %s", response.status_code)
                 response.raise_for_status()
-            
+
             return response_data
-            
+
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"HTTP request failed: {str(e)}")
+            self.logger.error("HTTP request failed: %s", e)
             raise ConnectionError(f"Failed to send data to {target_url}: {str(e)}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
-            raise ValueError(f"Failed to send data: {str(e)}")
-    
-    def send_batch(self, data_list: list, method: str = 'POST', 
-                   endpoint: Optional[str] = None) -> list:
+
+    def send_batch(self, data_list: list, method: str = 'POST',
+                   endpoint: Optional[str] = None, max_workers: int = 8) -> list:
         """
         Send multiple data items in batch.
-        
+
+        Items are sent concurrently over the pooled session so the batch
+        latency approaches the slowest request instead of the sum of all
+        round trips. Results keep the order of data_list.
+
         Args:
             data_list (list): List of data dictionaries to send
             method (str): HTTP method (default: POST)
             endpoint (str, optional): Additional endpoint path
-        
+            max_workers (int): Maximum concurrent requests (default: 8)
+
         Returns:
             list: List of response data for each item
         """
-        results = []
-        for i, data in enumerate(data_list):
+        if not data_list:
+            return []
+
+        results = [None] * len(data_list)
+        workers = min(max_workers, len(data_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.send, data, method, endpoint): i
+                for i, data in enumerate(data_list)
+            }
+            for future in futures:
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    self.logger.error("Failed to send batch item %s: %s", i, e)
+                    results[i] = {
+                        'success': False,
+                        'error': str(e),
+                        'data': data_list[i]
+                    }
+        return results
+    
+    def _get_async_client(self):
+        """Create the shared async client on first use."""
+        if httpx is None:
+            raise ImportError("httpx is required for async support. Install with: pip install httpx")
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100),
+                headers=self.headers,
+                timeout=self.timeout
+            )
+        return self._aclient
+
+    async def send_async(self, data: Dict[str, Any], method: str = 'POST',
+                         endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send data to HTTP endpoint asynchronously.
+
+        Requests are multiplexed on the event loop instead of one OS
+        thread per in-flight request, so high fan-out callers avoid the
+        per-thread stack and context-switch cost of send_batch.
+
+        Args:
+            data (dict): Data to send
+            method (str): HTTP method (default: POST)
+            endpoint (str, optional): Additional endpoint path
+
+        Returns:
+            dict: Response data with status and content
+
+        Raises:
+            ImportError: If httpx is not installed
+            ValueError: If data is invalid
+            ConnectionError: If request fails
+        """
+        validated_data = validate_data(data)
+
+        target_url = self._target_url(endpoint)
+
+        client = self._get_async_client()
+        try:
+            response = await client.request(method.upper(), target_url, json=validated_data)
+
+            response_data = {
+                'status_code': response.status_code,
+                'success': response.is_success,
+                'url': target_url,
+                'method': method.upper(),
+                'data_sent': validated_data
+            }
+
             try:
-                result = self.send(data, method, endpoint)
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Failed to send batch item {i}: {str(e)}")
+                if response.content:
+                    response_data['response'] = response.json()
+            except json.JSONDecodeError:
+                response_data['response'] = response.text
+
+            if response.is_success:
+                self.logger.info("Successfully sent data to %s", target_url)
+            else:
+                self.logger.warning("Request failed with status %s", response.status_code)
+                response.raise_for_status()
+
+            return response_data
+
+        except httpx.HTTPError as e:
+            self.logger.error("HTTP request failed: %s", e)
+            raise ConnectionError(f"Failed to send data to {target_url}: {str(e)}")
+
+    async def send_batch_async(self, data_list: list, method: str = 'POST',
+                               endpoint: Optional[str] = None) -> list:
+        """
+        Send multiple data items concurrently on the event loop.
+
+        All items are in flight at once (bounded by the client's
+        connection limit); failures surface as per-item error dicts in
+        input order, matching send_batch.
+
+        Args:
+            data_list (list): List of data dictionaries to send
+            method (str): HTTP method (default: POST)
+            endpoint (str, optional): Additional endpoint path
+
+        Returns:
+            list: List of response data for each item
+        """
+        outcomes = await asyncio.gather(
+            *(self.send_async(data, method, endpoint) for data in data_list),
+            return_exceptions=True
+        )
+
+        results = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error("Failed to send batch item %s: %s", i, outcome)
                 results.append({
                     'success': False,
-                    'error': str(e),
-                    'data': data
+                    'error': str(outcome),
+                    'data': data_list[i]
                 })
+            else:
+                results.append(outcome)
         return results
-    
+
+    async def aclose(self):
+        """Close the async client and release its connections."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
     def update_auth_token(self, token: str):
         """
         Update the Bearer authentication token.
@@ -149,6 +421,7 @@ class HTTPPublisher:
             token (str): New authentication token
         """
         self.headers['Authorization'] = f'Bearer {token}'
+        self._session.headers['Authorization'] = self.headers['Authorization']
         self.logger.info("Authentication token updated")
     
     def add_header(self, key: str, value: str):
@@ -160,6 +433,7 @@ class HTTPPublisher:
             value (str): Header value
         """
         self.headers[key] = value
+        self._session.headers[key] = value
     
     def remove_header(self, key: str):
         """
@@ -170,15 +444,36 @@ class HTTPPublisher:
         """
         if key in self.headers:
             del self.headers[key]
+        if key in self._session.headers:
+            del self._session.headers[key]
     
-    def get_headers(self) -> Dict[str, str]:
+    def get_headers(self, mutable: bool = False) -> Dict[str, str]:
         """
         Get current headers.
-        
+
+        By default returns a read-only live view, so frequent inspection
+        (logging, middleware) does not allocate a dict per call; pass
+        mutable=True for a detached copy the caller may modify.
+
+        Args:
+            mutable (bool): Return a mutable copy instead of the view
+
         Returns:
             dict: Current headers
         """
-        return self.headers.copy()
+        if mutable:
+            return dict(self.headers)
+        return self._headers_view
+
+    def close(self):
+        """Close the underlying session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 class HTTPReceiver:
@@ -196,7 +491,7 @@ class HTTPReceiver:
         """
         self.host = host
         self.port = port
-        self.logger = logging.getLogger(f"iotkit.http.receiver.{host}:{port}")
+        self.logger = logging.getLogger("iotkit.http.receiver")
         self._callbacks = {}
     
     def add_endpoint(self, path: str, callback: callable, methods: list = None):
@@ -210,11 +505,10 @@ class HTTPReceiver:
         """
         if methods is None:
             methods = ['POST']
-        
-        self._callbacks[path] = {
-            'callback': callback,
-            'methods': methods
-        }
+
+        # Compile the route at registration: method case is normalized
+        # once and membership tests on the request path are O(1)
+        self._callbacks[path] = (callback, frozenset(m.upper() for m in methods))
     
     def start_server(self):
         """
@@ -223,12 +517,15 @@ class HTTPReceiver:
         Note: This is a simple implementation. For production use,
         consider using Flask, FastAPI, or similar frameworks.
         """
-        from http.server import HTTPServer, BaseHTTPRequestHandler
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
         import urllib.parse as urlparse
         
         class RequestHandler(BaseHTTPRequestHandler):
             def __init__(self, receiver, *args, **kwargs):
                 self.receiver = receiver
+                # Reusable body buffer: one allocation per connection
+                # instead of one bytes object per request (grown lazily)
+                self._buf = bytearray(65536)
                 super().__init__(*args, **kwargs)
             
             def do_POST(self):
@@ -244,24 +541,38 @@ class HTTPReceiver:
                     path = parsed_path.path
                     
                     # Check if we have a handler for this path
-                    if path in self.receiver._callbacks:
-                        endpoint_config = self.receiver._callbacks[path]
-                        
-                        if method in endpoint_config['methods']:
-                            # Read request data
+                    entry = self.receiver._callbacks.get(path)
+                    if entry is not None:
+                        callback, allowed_methods = entry
+
+                        if method in allowed_methods:
+                            # Read request data straight into the
+                            # reusable buffer; the parser consumes the
+                            # bytes without an intermediate str decode
                             content_length = int(self.headers.get('Content-Length', 0))
                             if content_length > 0:
-                                post_data = self.rfile.read(content_length)
+                                if content_length > len(self._buf):
+                                    self._buf = bytearray(content_length)
+                                mv = memoryview(self._buf)[:content_length]
+                                read = 0
+                                while read < content_length:
+                                    n = self.rfile.readinto(mv[read:])
+                                    if not n:
+                                        break
+                                    read += n
                                 try:
-                                    data = json.loads(post_data.decode('utf-8'))
-                                except json.JSONDecodeError:
-                                    data = post_data.decode('utf-8')
+                                    if orjson is not None:
+                                        data = orjson.loads(mv[:read])
+                                    else:
+                                        data = json.loads(bytes(mv[:read]))
+                                except ValueError:
+                                    data = bytes(mv[:read]).decode('utf-8')
                             else:
                                 data = None
                             
                             # Call the callback
                             try:
-                                response = endpoint_config['callback'](data, method, path)
+                                response = callback(data, method, path)
                                 
                                 # Send response
                                 self.send_response(200)
@@ -269,16 +580,16 @@ class HTTPReceiver:
                                 self.end_headers()
                                 
                                 if isinstance(response, dict):
-                                    self.wfile.write(json.dumps(response).encode())
+                                    self.wfile.write(_dumps(response))
                                 else:
                                     self.wfile.write(str(response).encode())
                                     
                             except Exception as e:
-                                self.receiver.logger.error(f"Error in callback: {str(e)}")
+                                self.receiver.logger.error("Error in callback: %s", e)
                                 self.send_response(500)
                                 self.send_header('Content-Type', 'application/json')
                                 self.end_headers()
-                                self.wfile.write(json.dumps({'error': str(e)}).encode())
+                                self.wfile.write(_dumps({'error': str(e)}))
                         else:
                             # Method not allowed
                             self.send_response(405)
@@ -289,16 +600,17 @@ class HTTPReceiver:
                         self.end_headers()
                         
                 except Exception as e:
-                    self.receiver.logger.error(f"Error handling request: {str(e)}")
+                    self.receiver.logger.error("Error handling request: %s", e)
                     self.send_response(500)
                     self.end_headers()
         
         # Create handler with receiver reference
         handler = lambda *args, **kwargs: RequestHandler(self, *args, **kwargs)
         
-        # Start server
-        server = HTTPServer((self.host, self.port), handler)
-        self.logger.info(f"HTTP Receiver started on {self.host}:{self.port}")
+        # Threaded server: one slow callback no longer blocks every
+        # other in-flight request
+        server = ThreadingHTTPServer((self.host, self.port), handler)
+        self.logger.info("HTTP Receiver started on %s:%s", self.host, self.port)
         
         try:
             server.serve_forever()
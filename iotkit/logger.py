@@ -7,11 +7,74 @@ This module provides data logging functionality for IoT data.
 import csv
 import json
 import os
+import queue
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, Any, List, Union
 import logging
 
-from .utils import generate_timestamp, validate_data
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from .utils import generate_timestamp, validate_batch, validate_data
+
+# Shuts down the async writer thread when it reaches the queue
+_SENTINEL = object()
+
+
+def _count_newlines(filename: str) -> int:
+    """Count newlines in 1 MiB binary chunks, no per-line parsing."""
+    with open(filename, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+
+
+def _csv_quote(field: Any) -> str:
+    """Quote a CSV field only when it actually needs quoting."""
+    s = str(field)
+    if ',' in s or '"' in s or '\n' in s or '\r' in s:
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
+
+# Core CSV columns; every other key in a record lands in the metadata
+# column
+_CSV_FIELDS = frozenset(('timestamp', 'name', 'value'))
+
+
+def _meta_str(data: Dict[str, Any]) -> str:
+    """
+    Build the CSV metadata column for a record.
+
+    The common case — a record carrying only the three core fields —
+    short-circuits on a set comparison without building the extras dict
+    or serializing anything.
+    """
+    if data.keys() <= _CSV_FIELDS:
+        return ''
+    metadata = {k: v for k, v in data.items() if k not in _CSV_FIELDS}
+    return _dump_meta(metadata)
+
+
+def _dump_meta(metadata: Dict[str, Any]) -> str:
+    """Serialize the CSV metadata column (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(metadata, default=str).decode('utf-8')
+    return json.dumps(metadata, default=str)
+
+
+def _dump_json_line(data: Dict[str, Any]) -> bytes:
+    """Encode one record as a JSON line (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str) + b"\n"
+    return (json.dumps(data, ensure_ascii=False, default=str) + "\n").encode('utf-8')
 
 
 class DataLogger:
@@ -21,50 +84,227 @@ class DataLogger:
     """
     
     def __init__(self, filename: str = "data.csv", format_type: str = "csv", 
-                 auto_create_dir: bool = True):
+                 auto_create_dir: bool = True, async_writes: bool = False,
+                 queue_size: int = 10000, flush_every: int = 0,
+                 fsync_every: int = 0):
         """
         Initialize the data logger.
         
         Args:
             filename (str): Output filename (default: "data.csv")
-            format_type (str): Output format - "csv" or "json" (default: "csv")
+            format_type (str): Output format - "csv", "json", or "msgpack"
+                (default: "csv"); msgpack is a compact binary format that
+                skips text encoding entirely
             auto_create_dir (bool): Automatically create directory if not exists
+            async_writes (bool): Hand records to a background writer
+                thread instead of blocking the caller on file I/O;
+                close() drains the queue before returning
+            queue_size (int): Bound on queued records in async mode;
+                log() blocks once the writer falls this far behind
+            flush_every (int): Flush the write buffer every N records;
+                0 (default) leaves flushing to the buffer, flush() and
+                close()
+            fsync_every (int): Force records to disk with os.fsync every
+                N records; 0 (default) never fsyncs. Durability knob —
+                small values survive power loss at a large throughput
+                cost
         
         Raises:
-            ValueError: If format_type is not "csv" or "json"
+            ValueError: If format_type is not "csv", "json", or "msgpack"
+            ImportError: If format_type is "msgpack" and msgpack is not installed
         """
-        if format_type not in ["csv", "json"]:
-            raise ValueError("format_type must be either 'csv' or 'json'")
+        if format_type not in ["csv", "json", "msgpack"]:
+            raise ValueError("format_type must be 'csv', 'json', or 'msgpack'")
+        if format_type == "msgpack" and msgpack is None:
+            raise ImportError("msgpack is required for msgpack support. Install with: pip install msgpack")
         
         self.filename = filename
         self.format_type = format_type
         self.auto_create_dir = auto_create_dir
-        self.logger = logging.getLogger(f"iotkit.logger.{filename}")
+        # Durability policy counters; see _note_writes()
+        self.flush_every = flush_every
+        self.fsync_every = fsync_every
+        self._since_flush = 0
+        self._since_fsync = 0
+        self.logger = logging.getLogger("iotkit.logger")
         
-        # Create directory if needed
+        # Create directory if needed; exist_ok makes the extra stat
+        # probe unnecessary
         if self.auto_create_dir:
             directory = os.path.dirname(self.filename)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                self.logger.info(f"Created directory: {directory}")
+            if directory:
+                os.makedirs(directory, exist_ok=True)
         
         # Initialize file if it doesn't exist
         self._initialize_file()
-    
+
+        # Persistent append handle with large block buffering; records stay
+        # in the buffer until flush()/close() instead of hitting the disk
+        # per write
+        self._file = None
+        self._writer = None
+        self._open_output()
+
+        # Async mode: producers enqueue, one daemon thread drains the
+        # queue in whatever batch has accumulated and writes it in bulk
+        self.async_writes = async_writes
+        self._queue = None
+        self._worker = None
+        if async_writes:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._worker = threading.Thread(target=self._drain_queue, daemon=True)
+            self._worker.start()
+
+    def _drain_queue(self):
+        """Worker loop: batch up queued records and write them in bulk."""
+        q = self._queue
+        while True:
+            item = q.get()
+            if item is _SENTINEL:
+                return
+            batch = [item]
+            stop = False
+            # Take everything already waiting so one write covers it
+            try:
+                while True:
+                    nxt = q.get_nowait()
+                    if nxt is _SENTINEL:
+                        stop = True
+                        break
+                    batch.append(nxt)
+            except queue.Empty:
+                pass
+            try:
+                self._write_records(batch)
+                self._file.flush()
+                self._note_writes(len(batch))
+            except Exception as e:
+                self.logger.error(f"Async write failed: {str(e)}")
+            if stop:
+                return
+
+    def _write_records(self, records: List[Dict[str, Any]]):
+        """Write already-validated records in one bulk operation."""
+        if self.format_type == "csv":
+            rows = [(data.get('timestamp', ''),
+                     data.get('name', ''),
+                     data.get('value', ''),
+                     _meta_str(data)) for data in records]
+            self._writer.writerows(rows)
+        elif self.format_type == "json":
+            if self._legacy_array:
+                self._append_array_payload(
+                    b",".join(_dump_json_line(data).rstrip(b"\n") for data in records))
+            else:
+                self._file.write(b"".join(_dump_json_line(data) for data in records))
+        elif self.format_type == "msgpack":
+            self._file.write(b"".join(
+                msgpack.packb(data, use_bin_type=True, default=str) for data in records
+            ))
+
+    def _note_writes(self, n: int = 1):
+        """
+        Apply the flush/fsync durability policy after n written records.
+
+        Both thresholds are amortized: one flush (and at most one fsync)
+        per N records rather than per record, so batch workloads pay the
+        durability cost once per threshold crossing.
+        """
+        if self.flush_every:
+            self._since_flush += n
+            if self._since_flush >= self.flush_every:
+                self._file.flush()
+                self._since_flush = 0
+        if self.fsync_every:
+            self._since_fsync += n
+            if self._since_fsync >= self.fsync_every:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._since_fsync = 0
+
+    def _open_output(self):
+        """Open the persistent append handle used for logging."""
+        self._legacy_array = False
+        if self.format_type == "csv":
+            self._file = open(self.filename, 'a', newline='', encoding='utf-8',
+                              buffering=1024 * 1024)
+            self._writer = csv.writer(self._file)
+        elif self.format_type in ("json", "msgpack"):
+            if self.format_type == "json":
+                # Files from older releases hold one JSON array; appends
+                # splice into it in place instead of rewriting the file
+                try:
+                    with open(self.filename, 'rb') as probe:
+                        self._legacy_array = probe.read(1) == b'['
+                except OSError:
+                    pass
+            if self._legacy_array:
+                self._file = open(self.filename, 'r+b')
+            else:
+                # Byte-stream output: records append as raw bytes
+                self._file = open(self.filename, 'ab', buffering=1024 * 1024)
+
+    def _append_array_payload(self, payload: bytes) -> None:
+        """
+        Splice serialized records into a legacy JSON-array file in place.
+
+        Seeks to the closing bracket, truncates it off, and writes
+        ",<payload>]" — an O(1) append instead of the old
+        load-whole-array, append, rewrite cycle. payload holds one or
+        more comma-joined serialized records. An empty payload is a
+        no-op: splicing it would leave a dangling comma in the array.
+        """
+        if not payload:
+            return
+        f = self._file
+        end = f.seek(0, os.SEEK_END)
+
+        # Scan back past trailing whitespace to the closing bracket, then
+        # one more non-whitespace byte to detect the empty-array case
+        pos = end
+        ch = b''
+        while pos > 0:
+            pos -= 1
+            f.seek(pos)
+            ch = f.read(1)
+            if not ch.isspace():
+                break
+        if ch != b']':
+            raise IOError(f"{self.filename} is not a JSON array file")
+
+        prev = pos
+        before = b'['
+        while prev > 0:
+            prev -= 1
+            f.seek(prev)
+            before = f.read(1)
+            if not before.isspace():
+                break
+
+        f.seek(pos)
+        f.truncate(pos)
+        if before != b'[':
+            f.write(b',')
+        f.write(payload)
+        f.write(b']')
+
     def _initialize_file(self):
         """Initialize the log file with headers if it doesn't exist."""
-        if not os.path.exists(self.filename):
+        # Exclusive-create mode doubles as the existence check
+        try:
             if self.format_type == "csv":
                 # Create CSV with headers
-                with open(self.filename, 'w', newline='', encoding='utf-8') as csvfile:
+                with open(self.filename, 'x', newline='', encoding='utf-8') as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(['timestamp', 'name', 'value', 'metadata'])
-                    self.logger.info(f"Created CSV file: {self.filename}")
-            elif self.format_type == "json":
-                # Create JSON with empty array
-                with open(self.filename, 'w', encoding='utf-8') as jsonfile:
-                    json.dump([], jsonfile)
-                    self.logger.info(f"Created JSON file: {self.filename}")
+                self.logger.info(f"Created CSV file: {self.filename}")
+            elif self.format_type in ("json", "msgpack"):
+                # Create empty record-stream file
+                with open(self.filename, 'xb'):
+                    pass
+                self.logger.info(f"Created {self.format_type} file: {self.filename}")
+        except FileExistsError:
+            pass
     
     def log(self, data: Dict[str, Any], metadata: Dict[str, Any] = None) -> bool:
         """
@@ -92,11 +332,19 @@ class DataLogger:
             # Add metadata if provided
             if metadata:
                 validated_data['metadata'] = metadata
-            
+
+            if self.async_writes:
+                # Producer returns as soon as the record is queued; the
+                # worker thread pays the write cost
+                self._queue.put(validated_data)
+                return True
+
             if self.format_type == "csv":
                 return self._log_csv(validated_data)
             elif self.format_type == "json":
                 return self._log_json(validated_data)
+            elif self.format_type == "msgpack":
+                return self._log_msgpack(validated_data)
                 
         except Exception as e:
             self.logger.error(f"Failed to log data: {str(e)}")
@@ -105,53 +353,89 @@ class DataLogger:
     def _log_csv(self, data: Dict[str, Any]) -> bool:
         """Log data to CSV file."""
         try:
-            with open(self.filename, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Extract main fields
-                timestamp = data.get('timestamp', '')
-                name = data.get('name', '')
-                value = data.get('value', '')
-                
-                # Convert metadata to JSON string
-                metadata = {k: v for k, v in data.items() 
-                           if k not in ['timestamp', 'name', 'value']}
-                metadata_str = json.dumps(metadata) if metadata else ''
-                
-                writer.writerow([timestamp, name, value, metadata_str])
-                self.logger.debug(f"Logged to CSV: {data}")
-                return True
-                
+            # Extract main fields
+            timestamp = data.get('timestamp', '')
+            name = data.get('name', '')
+            value = data.get('value', '')
+
+            # Convert metadata to JSON string
+            metadata_str = _meta_str(data)
+
+            # Fixed 4-column schema: format the row directly rather than
+            # paying csv.writer's generic per-field dialect logic (the
+            # ISO timestamp never needs quoting)
+            self._file.write(
+                f"{timestamp},{_csv_quote(name)},{_csv_quote(value)},{_csv_quote(metadata_str)}\r\n"
+            )
+            self._note_writes()
+            self.logger.debug("Logged to CSV: %s", data)
+            return True
+
         except Exception as e:
             self.logger.error(f"CSV logging error: {str(e)}")
             return False
     
     def _log_json(self, data: Dict[str, Any]) -> bool:
-        """Log data to JSON file."""
+        """Append data to the JSON-lines file."""
         try:
-            # Read existing data
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as jsonfile:
-                    try:
-                        existing_data = json.load(jsonfile)
-                    except json.JSONDecodeError:
-                        existing_data = []
+            if self._legacy_array:
+                self._append_array_payload(_dump_json_line(data).rstrip(b"\n"))
             else:
-                existing_data = []
-            
-            # Append new data
-            existing_data.append(data)
-            
-            # Write back to file
-            with open(self.filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(existing_data, jsonfile, indent=2, ensure_ascii=False)
-                self.logger.debug(f"Logged to JSON: {data}")
-                return True
-                
+                self._file.write(_dump_json_line(data))
+            self._note_writes()
+            self.logger.debug("Logged to JSON: %s", data)
+            return True
+
         except Exception as e:
             self.logger.error(f"JSON logging error: {str(e)}")
             return False
     
+    def _log_msgpack(self, data: Dict[str, Any]) -> bool:
+        """Append one record to the msgpack stream."""
+        try:
+            self._file.write(msgpack.packb(data, use_bin_type=True, default=str))
+            self._note_writes()
+            return True
+
+        except Exception as e:
+            self.logger.error(f"msgpack logging error: {str(e)}")
+            return False
+
+    def log_raw(self, data: Dict[str, Any], payload: str = None) -> bool:
+        """
+        Log data that the caller has already validated and JSON-encoded.
+
+        Skips re-validation so a reading fanned out to several sinks pays
+        the validation/serialization cost only once. The pre-encoded payload
+        is used where the output format can take it directly.
+
+        Args:
+            data (dict): Data to log (already validated)
+            payload (str, optional): Pre-encoded JSON representation of data
+
+        Returns:
+            bool: True if logged successfully
+        """
+        if self.format_type == "csv":
+            return self._log_csv(data)
+        elif self.format_type == "json":
+            if payload is not None:
+                try:
+                    if isinstance(payload, str):
+                        payload = payload.encode('utf-8')
+                    if self._legacy_array:
+                        self._append_array_payload(payload.rstrip(b"\n"))
+                    else:
+                        self._file.write(payload + b"\n")
+                    self._note_writes()
+                    return True
+                except Exception as e:
+                    self.logger.error(f"JSON logging error: {str(e)}")
+                    return False
+            return self._log_json(data)
+        elif self.format_type == "msgpack":
+            return self._log_msgpack(data)
+
     def log_batch(self, data_list: List[Dict[str, Any]]) -> int:
         """
         Log multiple data items in batch.
@@ -163,16 +447,111 @@ class DataLogger:
             int: Number of successfully logged items
         """
         success_count = 0
-        for data in data_list:
+
+        # Validate the whole batch in one pass; only when it contains a
+        # bad record do we fall back to per-record validation so the good
+        # rows still get logged
+        try:
+            valid = validate_batch(data_list)
+        except ValueError:
+            valid = []
+            for data in data_list:
+                try:
+                    valid.append(validate_data(data))
+                except Exception as e:
+                    self.logger.error(f"Failed to log batch item: {str(e)}")
+
+        if self.format_type == "msgpack":
+            # Pack the whole batch and append it with a single write
+            packed = []
+            for validated_data in valid:
+                if 'timestamp' not in validated_data:
+                    validated_data['timestamp'] = generate_timestamp()
+                packed.append(msgpack.packb(validated_data, use_bin_type=True, default=str))
             try:
-                if self.log(data):
-                    success_count += 1
+                self._file.write(b"".join(packed))
+                success_count = len(packed)
             except Exception as e:
-                self.logger.error(f"Failed to log batch item: {str(e)}")
-        
-        self.logger.info(f"Batch log completed: {success_count}/{len(data_list)} successful")
+                self.logger.error(f"Failed to write batch: {str(e)}")
+
+            self._note_writes(success_count)
+            self.flush()
+            self.logger.info("Batch log completed: %d/%d successful", success_count, len(data_list))
+            return success_count
+
+        if self.format_type == "json":
+            # Encode the whole batch and append it with a single write
+            lines = []
+            for validated_data in valid:
+                if 'timestamp' not in validated_data:
+                    validated_data['timestamp'] = generate_timestamp()
+                lines.append(_dump_json_line(validated_data))
+            try:
+                if lines:
+                    if self._legacy_array:
+                        self._append_array_payload(
+                            b",".join(line.rstrip(b"\n") for line in lines))
+                    else:
+                        self._file.write(b"".join(lines))
+                success_count = len(lines)
+            except Exception as e:
+                self.logger.error(f"Failed to write batch: {str(e)}")
+
+            # One flush for the whole batch rather than per record
+            self._note_writes(success_count)
+            self.flush()
+            self.logger.info("Batch log completed: %d/%d successful", success_count, len(data_list))
+            return success_count
+
+        # Prepare every row first, then emit them with one writerows call
+        # so timestamping and the write are not interleaved per record
+        rows = []
+        for validated_data in valid:
+            if 'timestamp' not in validated_data:
+                validated_data['timestamp'] = generate_timestamp()
+            rows.append((validated_data.get('timestamp', ''),
+                         validated_data.get('name', ''),
+                         validated_data.get('value', ''),
+                         _meta_str(validated_data)))
+
+        try:
+            self._writer.writerows(rows)
+            success_count = len(rows)
+        except Exception as e:
+            self.logger.error(f"Failed to write batch: {str(e)}")
+
+        self._note_writes(success_count)
+        self.flush()
+        self.logger.info("Batch log completed: %d/%d successful", success_count, len(data_list))
         return success_count
     
+    def flush(self):
+        """Flush buffered records to disk."""
+        if self._file is not None and not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        """Drain pending writes, then flush and close the file handle."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(_SENTINEL)
+            self._worker.join()
+            self._worker = None
+        if self._file is not None and not self._file.closed:
+            self._file.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def read_data(self, limit: int = None) -> List[Dict[str, Any]]:
         """
         Read logged data from file.
@@ -187,6 +566,9 @@ class DataLogger:
             IOError: If file operations fail
         """
         try:
+            # Make buffered records visible to the reader
+            self.flush()
+
             if not os.path.exists(self.filename):
                 return []
             
@@ -194,6 +576,8 @@ class DataLogger:
                 return self._read_csv(limit)
             elif self.format_type == "json":
                 return self._read_json(limit)
+            elif self.format_type == "msgpack":
+                return self._read_msgpack(limit)
                 
         except Exception as e:
             self.logger.error(f"Failed to read data: {str(e)}")
@@ -226,13 +610,30 @@ class DataLogger:
         return data
     
     def _read_json(self, limit: int = None) -> List[Dict[str, Any]]:
-        """Read data from JSON file."""
-        with open(self.filename, 'r', encoding='utf-8') as jsonfile:
-            data = json.load(jsonfile)
-            if limit:
-                return data[-limit:]  # Return latest records
-            return data
+        """Read data from JSON-lines file (legacy array files still supported)."""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.filename, 'rb') as jsonfile:
+            prefix = jsonfile.read(16)
+            jsonfile.seek(0)
+
+            if prefix.lstrip().startswith(b'['):
+                # Legacy format: whole file is one JSON array
+                data = json.loads(jsonfile.read())
+                return data[-limit:] if limit else data
+
+            # Tail reads keep only the last `limit` lines in memory
+            # instead of materializing and slicing the whole file
+            lines = deque(jsonfile, maxlen=limit) if limit else jsonfile
+            return [loads(line) for line in lines if line.strip()]
     
+    def _read_msgpack(self, limit: int = None) -> List[Dict[str, Any]]:
+        """Read records from the msgpack stream."""
+        with open(self.filename, 'rb') as packfile:
+            unpacker = msgpack.Unpacker(packfile, raw=False)
+            if limit:
+                return list(deque(unpacker, maxlen=limit))
+            return list(unpacker)
+
     def clear_data(self) -> bool:
         """
         Clear all logged data.
@@ -241,7 +642,17 @@ class DataLogger:
             bool: True if cleared successfully
         """
         try:
+            self.close()
+            # _initialize_file only creates missing files, so remove the
+            # old one to actually drop its records
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
             self._initialize_file()
+            self._open_output()
+            # close() stopped the async worker; bring it back up
+            if self.async_writes and self._worker is None:
+                self._worker = threading.Thread(target=self._drain_queue, daemon=True)
+                self._worker.start()
             self.logger.info(f"Cleared data file: {self.filename}")
             return True
         except Exception as e:
@@ -255,6 +666,9 @@ class DataLogger:
         Returns:
             dict: Statistics including record count, file size, etc.
         """
+        # Make buffered records visible before measuring the file
+        self.flush()
+
         stats = {
             'filename': self.filename,
             'format': self.format_type,
@@ -273,15 +687,32 @@ class DataLogger:
                 mtime = os.path.getmtime(self.filename)
                 stats['last_modified'] = datetime.fromtimestamp(mtime).isoformat()
                 
-                # Record count
+                # Record count: one record per line in both formats, so
+                # a raw newline scan replaces per-row parsing
                 if self.format_type == "csv":
-                    with open(self.filename, 'r', encoding='utf-8') as csvfile:
-                        reader = csv.reader(csvfile)
-                        stats['record_count'] = sum(1 for row in reader) - 1  # Subtract header
+                    stats['record_count'] = max(0, _count_newlines(self.filename) - 1)  # Subtract header
                 elif self.format_type == "json":
-                    with open(self.filename, 'r', encoding='utf-8') as jsonfile:
-                        data = json.load(jsonfile)
-                        stats['record_count'] = len(data)
+                    with open(self.filename, 'rb') as jsonfile:
+                        prefix = jsonfile.read(16)
+                    if prefix.lstrip().startswith(b'['):
+                        # Legacy array files need a real parse to count
+                        with open(self.filename, 'rb') as jsonfile:
+                            stats['record_count'] = len(json.loads(jsonfile.read()))
+                    else:
+                        stats['record_count'] = _count_newlines(self.filename)
+                elif self.format_type == "msgpack":
+                    # Binary stream has no line structure; skim it with
+                    # the unpacker without materializing records
+                    with open(self.filename, 'rb') as packfile:
+                        unpacker = msgpack.Unpacker(packfile, raw=False)
+                        count = 0
+                        try:
+                            while True:
+                                unpacker.skip()
+                                count += 1
+                        except msgpack.OutOfData:
+                            pass
+                        stats['record_count'] = count
                         
             except Exception as e:
                 self.logger.error(f"Failed to get stats: {str(e)}")
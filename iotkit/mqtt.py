@@ -7,6 +7,7 @@ This module provides MQTT publisher and subscriber functionality for IoT communi
 import json
 import threading
 import time
+from collections import deque
 from typing import Callable, Dict, Any, Optional
 import logging
 
@@ -15,102 +16,217 @@ try:
 except ImportError:
     raise ImportError("paho-mqtt is required. Install with: pip install paho-mqtt")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 from .utils import validate_data
 
 
-class MQTTPublisher:
+def _encode_payload(data: Dict[str, Any]) -> bytes:
+    """Serialize a payload dict to bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode('utf-8')
+
+
+# Shared publisher sessions, one per broker/credentials pair. Each entry
+# owns a single paho client (one TCP handshake, one network thread) that
+# any number of MQTTPublisher instances publish through on their own
+# topics; entries are ref-counted and torn down when the last publisher
+# using them disconnects.
+_CLIENT_POOL: Dict[tuple, "_PooledConnection"] = {}
+_POOL_LOCK = threading.Lock()
+
+
+class _PooledConnection:
     """
-    MQTT Publisher for sending IoT data.
+    Shared broker session backing one or more MQTTPublisher instances.
     """
-    
-    def __init__(self, broker: str, topic: str, port: int = 1883, 
-                 username: Optional[str] = None, password: Optional[str] = None,
-                 client_id: Optional[str] = None):
-        """
-        Initialize MQTT Publisher.
-        
-        Args:
-            broker (str): MQTT broker address
-            topic (str): Default topic to publish to
-            port (int): MQTT broker port (default: 1883)
-            username (str, optional): Username for authentication
-            password (str, optional): Password for authentication
-            client_id (str, optional): Custom client ID
-        """
+
+    def __init__(self, key: tuple, password: Optional[str]):
+        broker, port, username, client_id = key
         self.broker = broker
-        self.topic = topic
         self.port = port
-        self.username = username
-        self.password = password
-        
-        # Initialize MQTT client
+        self.refs = 0
+        self.connected = False
+        self._connected_event = threading.Event()
+        # Pending confirms for publish_async(); bounded so a silent broker
+        # cannot grow the queue without limit. The lock covers the
+        # check-then-popleft sequences, which run concurrently on paho's
+        # network thread (_on_publish) and the caller (wait_for_acks)
+        self.pending = deque(maxlen=1000)
+        self.pending_lock = threading.Lock()
+        self.logger = logging.getLogger(f"iotkit.mqtt.publisher.{broker}")
+
         self.client = mqtt.Client(client_id=client_id or f"iotkit_pub_{int(time.time())}")
-        
-        # Set authentication if provided
         if username and password:
             self.client.username_pw_set(username, password)
-        
-        # Set callbacks
         self.client.on_connect = self._on_connect
         self.client.on_publish = self._on_publish
         self.client.on_disconnect = self._on_disconnect
-        
-        self.connected = False
-        self.logger = logging.getLogger(f"iotkit.mqtt.publisher.{self.broker}")
-    
+
     def _on_connect(self, client, userdata, flags, rc):
         """Callback for when client connects to broker."""
         if rc == 0:
             self.connected = True
+            self._connected_event.set()
             self.logger.info(f"Connected to MQTT broker {self.broker}:{self.port}")
         else:
             self.connected = False
             self.logger.error(f"Failed to connect to MQTT broker. Return code: {rc}")
-    
+
     def _on_publish(self, client, userdata, mid):
         """Callback for when message is published."""
-        self.logger.debug(f"Message published with ID: {mid}")
-    
+        # Reconcile acks off the critical path: acks arrive in order, so
+        # drop confirmed messages from the head of the pending queue
+        with self.pending_lock:
+            while self.pending and self.pending[0].is_published():
+                self.pending.popleft()
+        self.logger.debug("Message published with ID: %s", mid)
+
     def _on_disconnect(self, client, userdata, rc):
         """Callback for when client disconnects from broker."""
         self.connected = False
+        self._connected_event.clear()
         self.logger.info(f"Disconnected from MQTT broker. Return code: {rc}")
+
+    def connect(self, timeout: int) -> bool:
+        """Connect the shared client; no-op when already connected."""
+        if self.connected:
+            return True
+
+        self.client.connect(self.broker, self.port, 60)
+        self.client.loop_start()
+
+        # Block until _on_connect signals instead of polling at
+        # 10 Hz; wakes sub-millisecond after the CONNACK arrives
+        if not self._connected_event.wait(timeout):
+            raise ConnectionError(f"Failed to connect to {self.broker}:{self.port} within {timeout}s")
+
+        return True
+
+    def release(self, key: tuple):
+        """Drop one reference; close the session when none remain."""
+        with _POOL_LOCK:
+            # Idempotent: a second disconnect() on the same publisher
+            # must not drive the count negative or evict a fresh
+            # session that has since taken over the key
+            if self.refs <= 0:
+                return
+            self.refs -= 1
+            if self.refs > 0:
+                return
+            if _CLIENT_POOL.get(key) is self:
+                del _CLIENT_POOL[key]
+        self.client.loop_stop()
+        self.client.disconnect()
+        self.connected = False
+
+
+def _acquire_connection(key: tuple, password: Optional[str]) -> _PooledConnection:
+    """Look up or create the pooled session for key and take a reference."""
+    with _POOL_LOCK:
+        conn = _CLIENT_POOL.get(key)
+        if conn is None:
+            conn = _PooledConnection(key, password)
+            _CLIENT_POOL[key] = conn
+        conn.refs += 1
+        return conn
+
+
+class MQTTPublisher:
+    """
+    MQTT Publisher for sending IoT data.
+    """
     
+    def __init__(self, broker: str, topic: str, port: int = 1883, 
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 client_id: Optional[str] = None):
+        """
+        Initialize MQTT Publisher.
+        
+        Args:
+            broker (str): MQTT broker address
+            topic (str): Default topic to publish to
+            port (int): MQTT broker port (default: 1883)
+            username (str, optional): Username for authentication
+            password (str, optional): Password for authentication
+            client_id (str, optional): Custom client ID
+        """
+        self.broker = broker
+        self.topic = topic
+        self.port = port
+        self.username = username
+        self.password = password
+
+        # Publishers to the same broker with the same credentials share
+        # one pooled client instead of opening a session each
+        self._pool_key = (broker, port, username, client_id)
+        self._conn = _acquire_connection(self._pool_key, password)
+        self.client = self._conn.client
+        self.logger = self._conn.logger
+
+    @property
+    def connected(self) -> bool:
+        """Whether the shared broker session is connected."""
+        return self._conn.connected
+
+    @property
+    def _pending(self) -> deque:
+        """Pending publish confirms on the shared session."""
+        return self._conn.pending
+
     def connect(self, timeout: int = 10) -> bool:
         """
         Connect to MQTT broker.
-        
+
+        When another publisher already holds an open session to the same
+        broker this returns immediately without a new handshake.
+
         Args:
             timeout (int): Connection timeout in seconds
-        
+
         Returns:
             bool: True if connected successfully
-        
+
         Raises:
             ConnectionError: If connection fails
         """
         try:
-            self.client.connect(self.broker, self.port, 60)
-            self.client.loop_start()
-            
-            # Wait for connection
-            start_time = time.time()
-            while not self.connected and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if not self.connected:
-                raise ConnectionError(f"Failed to connect to {self.broker}:{self.port} within {timeout}s")
-            
-            return True
+            # Reconnecting after disconnect(): the reference on the
+            # pooled session was released, so take a new one — joining
+            # whatever session owns the key now, or re-registering the
+            # old one if the slot is free
+            with _POOL_LOCK:
+                if self._conn.refs <= 0:
+                    conn = _CLIENT_POOL.get(self._pool_key)
+                    if conn is None:
+                        conn = self._conn
+                        _CLIENT_POOL[self._pool_key] = conn
+                    conn.refs += 1
+                    self._conn = conn
+                    self.client = conn.client
+                    self.logger = conn.logger
+            return self._conn.connect(timeout)
         except Exception as e:
             self.logger.error(f"Connection error: {str(e)}")
             raise ConnectionError(f"Failed to connect to MQTT broker: {str(e)}")
-    
+
     def disconnect(self):
-        """Disconnect from MQTT broker."""
-        self.client.loop_stop()
-        self.client.disconnect()
-        self.connected = False
+        """
+        Release this publisher's hold on the shared broker session.
+
+        The underlying socket closes only when the last publisher using
+        the session disconnects.
+        """
+        self._conn.release(self._pool_key)
     
     def publish(self, data: Dict[str, Any], topic: Optional[str] = None, qos: int = 0) -> bool:
         """
@@ -132,9 +248,9 @@ class MQTTPublisher:
             raise ConnectionError("Not connected to MQTT broker. Call connect() first.")
         
         try:
-            # Validate and serialize data
+            # Validate and serialize data; paho takes the bytes as-is
             validated_data = validate_data(data)
-            message = json.dumps(validated_data)
+            message = _encode_payload(validated_data)
             
             # Use provided topic or default
             publish_topic = topic or self.topic
@@ -143,7 +259,7 @@ class MQTTPublisher:
             result = self.client.publish(publish_topic, message, qos)
             
             if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                self.logger.debug(f"Published to {publish_topic}: {message}")
+                self.logger.debug("Published to %s: %s", publish_topic, message)
                 return True
             else:
                 self.logger.error(f"Failed to publish message. Return code: {result.rc}")
@@ -153,6 +269,237 @@ class MQTTPublisher:
             self.logger.error(f"Publish error: {str(e)}")
             raise ValueError(f"Failed to publish data: {str(e)}")
 
+    def publish_async(self, data: Dict[str, Any], topic: Optional[str] = None, qos: int = 0) -> bool:
+        """
+        Publish data without waiting for the broker acknowledgement.
+
+        The message info is queued and reconciled by the on_publish callback
+        in the network thread; call wait_for_acks() to drain outstanding
+        confirmations before disconnecting.
+
+        Args:
+            data (dict): Data to publish
+            topic (str, optional): Topic to publish to (uses default if None)
+            qos (int): Quality of Service level (0, 1, or 2)
+
+        Returns:
+            bool: True if the message was handed to the client
+
+        Raises:
+            ConnectionError: If not connected to broker
+            ValueError: If data is invalid
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to MQTT broker. Call connect() first.")
+
+        try:
+            validated_data = validate_data(data)
+            message = _encode_payload(validated_data)
+
+            publish_topic = topic or self.topic
+
+            result = self.client.publish(publish_topic, message, qos)
+
+            if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                self._pending.append(result)
+                return True
+            else:
+                self.logger.error(f"Failed to publish message. Return code: {result.rc}")
+                return False
+
+        except Exception as e:
+            self.logger.error(f"Async publish error: {str(e)}")
+            raise ValueError(f"Failed to publish data: {str(e)}")
+
+    def publish_raw(self, payload: str, topic: Optional[str] = None, qos: int = 0) -> bool:
+        """
+        Publish a pre-encoded JSON payload without re-serializing.
+
+        Useful when the same reading is fanned out to several sinks: the
+        caller encodes once (see iotkit.utils.encode_json) and passes the
+        resulting string/bytes to each sink. Confirms are handled
+        asynchronously as in publish_async().
+
+        Args:
+            payload (str): Pre-encoded JSON payload
+            topic (str, optional): Topic to publish to (uses default if None)
+            qos (int): Quality of Service level (0, 1, or 2)
+
+        Returns:
+            bool: True if the message was handed to the client
+
+        Raises:
+            ConnectionError: If not connected to broker
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to MQTT broker. Call connect() first.")
+
+        publish_topic = topic or self.topic
+
+        result = self.client.publish(publish_topic, payload, qos)
+
+        if result.rc == mqtt.MQTT_ERR_SUCCESS:
+            self._pending.append(result)
+            return True
+        else:
+            self.logger.error(f"Failed to publish message. Return code: {result.rc}")
+            return False
+
+    def publish_prepared(self, template: bytes, values: tuple,
+                         topic: Optional[str] = None, qos: int = 0) -> bool:
+        """
+        Publish by filling a pre-built payload template.
+
+        For fixed-schema readings the static parts of the JSON payload
+        are encoded once by the caller; each publish interpolates only
+        the changing fields with printf-style bytes formatting instead
+        of re-serializing the whole dict. Confirms are handled
+        asynchronously as in publish_async().
+
+        Example:
+            template = b'{"name": "temp", "value": %.2f, "timestamp": "%b"}'
+            publisher.publish_prepared(template, (23.5, ts.encode()))
+
+        Args:
+            template (bytes): Payload template with %-style placeholders
+            values (tuple): Values interpolated into the template
+            topic (str, optional): Topic to publish to (uses default if None)
+            qos (int): Quality of Service level (0, 1, or 2)
+
+        Returns:
+            bool: True if the message was handed to the client
+
+        Raises:
+            ConnectionError: If not connected to broker
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to MQTT broker. Call connect() first.")
+
+        payload = template % values
+        publish_topic = topic or self.topic
+
+        result = self.client.publish(publish_topic, payload, qos)
+
+        if result.rc == mqtt.MQTT_ERR_SUCCESS:
+            self._pending.append(result)
+            return True
+        else:
+            self.logger.error(f"Failed to publish message. Return code: {result.rc}")
+            return False
+
+    def publish_many(self, data_list: list, topic: Optional[str] = None, qos: int = 0) -> int:
+        """
+        Publish many messages to one topic with a two-phase hand-off.
+
+        All payloads are validated and serialized up front, then handed to
+        the client back-to-back so the network thread can coalesce them
+        into few socket writes; nothing blocks between messages. The last
+        message joins the async confirm queue — call wait_for_acks() to
+        drain before disconnecting.
+
+        Args:
+            data_list (list): List of data dictionaries to publish
+            topic (str, optional): Topic to publish to (uses default if None)
+            qos (int): Quality of Service level (0, 1, or 2)
+
+        Returns:
+            int: Number of messages successfully handed to the client
+
+        Raises:
+            ConnectionError: If not connected to broker
+            ValueError: If any payload fails validation
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to MQTT broker. Call connect() first.")
+
+        try:
+            payloads = [_encode_payload(validate_data(data)) for data in data_list]
+        except Exception as e:
+            self.logger.error(f"Batch serialization error: {str(e)}")
+            raise ValueError(f"Failed to serialize batch: {str(e)}")
+
+        publish_topic = topic or self.topic
+        publish = self.client.publish
+        last_info = None
+        success_count = 0
+
+        for payload in payloads:
+            result = publish(publish_topic, payload, qos)
+            if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                last_info = result
+                success_count += 1
+            else:
+                self.logger.error(f"Failed to publish batch message. Return code: {result.rc}")
+
+        # Acks arrive in order, so tracking the last message covers the
+        # whole batch
+        if last_info is not None:
+            self._pending.append(last_info)
+
+        self.logger.debug("Handed off %d/%d messages to %s", success_count, len(data_list), publish_topic)
+        return success_count
+
+    def wait_for_acks(self):
+        """Block until all asynchronously published messages are acknowledged."""
+        pending = self._pending
+        lock = self._conn.pending_lock
+        while True:
+            # Pop under the lock, but wait outside it so the network
+            # thread's _on_publish reconciliation is never blocked
+            with lock:
+                if not pending:
+                    return
+                info = pending.popleft()
+            info.wait_for_publish()
+
+    def publish_batch(self, data_list: list, topic: Optional[str] = None, qos: int = 0) -> int:
+        """
+        Publish multiple messages with a single confirmation wait.
+
+        Messages are handed to the client back-to-back without waiting for
+        individual acknowledgements; one wait_for_publish() on the last
+        message confirms the whole batch, amortizing the ack roundtrip.
+
+        Args:
+            data_list (list): List of data dictionaries to publish
+            topic (str, optional): Topic to publish to (uses default if None)
+            qos (int): Quality of Service level (0, 1, or 2)
+
+        Returns:
+            int: Number of messages successfully handed to the client
+
+        Raises:
+            ConnectionError: If not connected to broker
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to MQTT broker. Call connect() first.")
+
+        publish_topic = topic or self.topic
+        last_info = None
+        success_count = 0
+
+        for data in data_list:
+            try:
+                validated_data = validate_data(data)
+                message = _encode_payload(validated_data)
+
+                result = self.client.publish(publish_topic, message, qos)
+
+                if result.rc == mqtt.MQTT_ERR_SUCCESS:
+                    last_info = result
+                    success_count += 1
+                else:
+                    self.logger.error(f"Failed to publish batch message. Return code: {result.rc}")
+            except Exception as e:
+                self.logger.error(f"Batch publish error: {str(e)}")
+
+        # Single synchronous confirm for the whole batch
+        if last_info is not None:
+            last_info.wait_for_publish()
+
+        self.logger.debug("Published batch of %d/%d messages to %s", success_count, len(data_list), publish_topic)
+        return success_count
+
 
 class MQTTSubscriber:
     """
@@ -195,12 +542,14 @@ class MQTTSubscriber:
         
         self.connected = False
         self.subscribed = False
+        self._connected_event = threading.Event()
         self.logger = logging.getLogger(f"iotkit.mqtt.subscriber.{self.broker}")
     
     def _on_connect(self, client, userdata, flags, rc):
         """Callback for when client connects to broker."""
         if rc == 0:
             self.connected = True
+            self._connected_event.set()
             self.logger.info(f"Connected to MQTT broker {self.broker}:{self.port}")
             # Auto-subscribe to topic
             self.client.subscribe(self.topic)
@@ -210,17 +559,28 @@ class MQTTSubscriber:
     
     def _on_message(self, client, userdata, msg):
         """Callback for when message is received."""
+        # No consumer registered: skip the decode entirely
+        if self.on_message_callback is None:
+            return
+
         try:
-            # Decode message
-            message_str = msg.payload.decode('utf-8')
-            message_data = json.loads(message_str)
-            
-            self.logger.debug(f"Received message from {msg.topic}: {message_str}")
-            
-            # Call user-defined callback if provided
-            if self.on_message_callback:
-                self.on_message_callback(msg.topic, message_data)
-                
+            payload = msg.payload
+            # Parse the payload bytes directly; no intermediate str decode
+            try:
+                if orjson is not None:
+                    message_data = orjson.loads(payload)
+                else:
+                    message_data = json.loads(payload)
+            except ValueError:
+                # Binary payloads (e.g. a msgpack-format DataLogger feed)
+                if msgpack is None:
+                    raise
+                message_data = msgpack.unpackb(payload, raw=False)
+
+            self.logger.debug("Received message from %s: %s", msg.topic, payload)
+
+            self.on_message_callback(msg.topic, message_data)
+
         except Exception as e:
             self.logger.error(f"Error processing message: {str(e)}")
     
@@ -228,6 +588,7 @@ class MQTTSubscriber:
         """Callback for when client disconnects from broker."""
         self.connected = False
         self.subscribed = False
+        self._connected_event.clear()
         self.logger.info(f"Disconnected from MQTT broker. Return code: {rc}")
     
     def connect(self, timeout: int = 10) -> bool:
@@ -247,12 +608,9 @@ class MQTTSubscriber:
             self.client.connect(self.broker, self.port, 60)
             self.client.loop_start()
             
-            # Wait for connection
-            start_time = time.time()
-            while not self.connected and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if not self.connected:
+            # Block until _on_connect signals instead of polling at
+            # 10 Hz; wakes sub-millisecond after the CONNACK arrives
+            if not self._connected_event.wait(timeout):
                 raise ConnectionError(f"Failed to connect to {self.broker}:{self.port} within {timeout}s")
             
             self.subscribed = True
@@ -5,6 +5,7 @@ This module provides virtual sensors for IoT simulation.
 """
 
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Dict, Any
 from .utils import generate_timestamp, validate_data
 
@@ -17,7 +18,10 @@ class Sensor:
     - random: generates random values within min-max range
     - manual: allows manual input of values
     """
-    
+
+    __slots__ = ('name', 'min_val', 'max_val', 'mode', '_manual_value', '_buf',
+                 '_rng', '_span')
+
     def __init__(self, name: str, min_val: float = 0, max_val: float = 100, mode: str = "random"):
         """
         Initialize the sensor.
@@ -39,7 +43,21 @@ class Sensor:
         self.max_val = max_val
         self.mode = mode
         self._manual_value = None
-        
+        # Private RNG (no lock contention on the module-global instance)
+        # and precomputed span for the inlined uniform draw in read()
+        self._rng = random.Random()
+        self._span = max_val - min_val
+        # Reusable sample buffer: to_dict() updates and returns this dict,
+        # so per-sample reads allocate nothing
+        self._buf = {
+            "name": name,
+            "value": 0.0,
+            "timestamp": "",
+            "min": min_val,
+            "max": max_val,
+            "mode": mode
+        }
+
     def read(self) -> float:
         """
         Read current sensor value.
@@ -51,12 +69,33 @@ class Sensor:
             ValueError: If in manual mode and no value has been set
         """
         if self.mode == "random":
-            return round(random.uniform(self.min_val, self.max_val), 2)
+            return round(self.min_val + self._rng.random() * self._span, 2)
         elif self.mode == "manual":
             if self._manual_value is None:
                 raise ValueError("Manual value not set. Use set_value() first.")
             return self._manual_value
     
+    def read_batch(self, count: int) -> list:
+        """
+        Generate a batch of readings in one call.
+
+        Amortizes per-read overhead for high-rate simulation: the RNG
+        method and range bounds are looked up once and all values are
+        produced in a single tight loop.
+
+        Args:
+            count (int): Number of readings to generate
+
+        Returns:
+            list: List of readings
+        """
+        if self.mode == "manual":
+            return [self.read() for _ in range(count)]
+
+        rng = self._rng.random
+        lo, span = self.min_val, self._span
+        return [round(lo + rng() * span, 2) for _ in range(count)]
+
     def set_value(self, value: float) -> None:
         """
         Set manual value for the sensor (only works in manual mode).
@@ -75,23 +114,29 @@ class Sensor:
         
         self._manual_value = value
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, value: float = None, ts: str = None) -> Dict[str, Any]:
         """
         Convert sensor data to dictionary format.
-        
+
+        The returned dict is a per-sensor buffer reused across calls to
+        avoid allocating a fresh dict per sample; callers that retain the
+        result beyond the next to_dict() call must copy it.
+
+        Args:
+            value (float, optional): Pre-generated reading (e.g. from
+                read_batch()); read() is called when omitted.
+            ts (str, optional): Shared timestamp for all sensors read in
+                the same tick; generated when omitted.
+
         Returns:
             dict: Sensor data with name, value, and timestamp
         """
         try:
-            value = self.read()
-            data = {
-                "name": self.name,
-                "value": value,
-                "timestamp": generate_timestamp(),
-                "min": self.min_val,
-                "max": self.max_val,
-                "mode": self.mode
-            }
+            if value is None:
+                value = self.read()
+            data = self._buf
+            data["value"] = value
+            data["timestamp"] = ts if ts is not None else generate_timestamp()
             return validate_data(data)
         except Exception as e:
             raise RuntimeError(f"Failed to read sensor data: {str(e)}")
@@ -105,7 +150,31 @@ class SensorCollection:
     def __init__(self):
         """Initialize empty sensor collection."""
         self.sensors = {}
-    
+        # Cached columnar view used by read_all/read_values; rebuilt
+        # lazily after the collection changes
+        self._cols = None
+
+    @classmethod
+    def from_configs(cls, configs: list) -> "SensorCollection":
+        """
+        Build a collection from a list of sensor configurations in one pass.
+
+        Bulk alternative to constructing sensors one by one and calling
+        add_sensor() per entry.
+
+        Args:
+            configs (list): List of dicts accepted by Sensor(**config)
+
+        Returns:
+            SensorCollection: Collection containing one sensor per config
+        """
+        collection = cls()
+        sensors = collection.sensors
+        for config in configs:
+            sensor = Sensor(**config)
+            sensors[sensor.name] = sensor
+        return collection
+
     def add_sensor(self, sensor: Sensor) -> None:
         """
         Add a sensor to the collection.
@@ -114,6 +183,7 @@ class SensorCollection:
             sensor (Sensor): Sensor instance to add
         """
         self.sensors[sensor.name] = sensor
+        self._cols = None
     
     def remove_sensor(self, name: str) -> None:
         """
@@ -124,22 +194,100 @@ class SensorCollection:
         """
         if name in self.sensors:
             del self.sensors[name]
+            self._cols = None
     
+    def _columns(self) -> tuple:
+        """
+        Columnar snapshot of the collection for tight read loops.
+
+        Mode checks, range bounds, and RNG method lookups are resolved
+        once here instead of per sensor per tick; add_sensor and
+        remove_sensor invalidate the cache.
+
+        Returns:
+            tuple: (names, rows) where each row is
+                (sensor, is_random, min_val, span, rng_draw)
+        """
+        cols = self._cols
+        if cols is None:
+            names = list(self.sensors.keys())
+            rows = [
+                (sensor, sensor.mode == "random",
+                 sensor.min_val, sensor._span, sensor._rng.random)
+                for sensor in self.sensors.values()
+            ]
+            cols = (names, rows)
+            self._cols = cols
+        return cols
+
     def read_all(self) -> Dict[str, Dict[str, Any]]:
         """
         Read all sensors in the collection.
-        
+
         Returns:
             dict: Dictionary of sensor data
         """
         data = {}
-        for name, sensor in self.sensors.items():
+        # One timestamp for the whole tick: the readings are taken
+        # together, so sharing it is semantically correct and saves a
+        # clock read per sensor
+        ts = generate_timestamp()
+        names, rows = self._columns()
+        for name, (sensor, is_random, lo, span, draw) in zip(names, rows):
             try:
-                data[name] = sensor.to_dict()
+                value = round(lo + draw() * span, 2) if is_random else sensor.read()
+                data[name] = sensor.to_dict(value, ts)
             except Exception as e:
-                data[name] = {"error": str(e), "timestamp": generate_timestamp()}
+                data[name] = {"error": str(e), "timestamp": ts}
         return data
-    
+
+    def read_all_parallel(self, max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Read all sensors concurrently with a thread pool.
+
+        Intended for collections mixing virtual sensors with Sensor
+        subclasses that wrap real, I/O-bound hardware reads: the pool
+        overlaps their latencies instead of paying them back-to-back.
+        For pure random/manual sensors read_all() is cheaper — threads
+        only add overhead there.
+
+        Args:
+            max_workers (int): Upper bound on concurrent reads
+
+        Returns:
+            dict: Dictionary of sensor data, one entry per sensor
+        """
+        ts = generate_timestamp()
+
+        def _read(sensor):
+            try:
+                return sensor.to_dict(None, ts)
+            except Exception as e:
+                return {"error": str(e), "timestamp": ts}
+
+        names = list(self.sensors.keys())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(names, executor.map(_read, self.sensors.values())))
+
+    def read_values(self) -> tuple:
+        """
+        Read all sensors into parallel (names, values) lists.
+
+        Columnar alternative to read_all(): draws come straight off the
+        cached column snapshot, no per-sensor dict built. Suited to
+        high-rate polling where the consumer only needs name/value pairs
+        and builds richer records at the sink boundary.
+
+        Returns:
+            tuple: (list of sensor names, list of readings)
+        """
+        names, rows = self._columns()
+        values = [
+            round(lo + draw() * span, 2) if is_random else sensor.read()
+            for sensor, is_random, lo, span, draw in rows
+        ]
+        return list(names), values
+
     def get_sensor(self, name: str) -> Union[Sensor, None]:
         """
         Get a specific sensor by name.
@@ -5,33 +5,45 @@ This module provides utility functions for IoT operations.
 """
 
 import json
-import re
+from collections import deque
 from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from urllib.parse import urlsplit
 from typing import Dict, Any, Union
-import uuid
+import os
+import time
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Formatter dispatch for generate_timestamp: one dict lookup replaces
+# the if/elif chain. The unix case reads the clock directly — no
+# datetime object needed for a whole-second epoch count.
+_TS_FORMATTERS = {
+    'iso': lambda: datetime.now(timezone.utc).isoformat(),
+    'unix': lambda: str(time.time_ns() // 1_000_000_000),
+    'custom': lambda: datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+}
+
 
 def generate_timestamp(format_type: str = "iso") -> str:
     """
     Generate current timestamp.
-    
+
     Args:
         format_type (str): Format type - "iso", "unix", or "custom"
-    
+
     Returns:
         str: Formatted timestamp
     """
-    now = datetime.now(timezone.utc)
-    
-    if format_type == "iso":
-        return now.isoformat()
-    elif format_type == "unix":
-        return str(int(now.timestamp()))
-    elif format_type == "custom":
-        return now.strftime("%Y-%m-%d %H:%M:%S UTC")
-    else:
-        return now.isoformat()
+    formatter = _TS_FORMATTERS.get(format_type)
+    if formatter is None:
+        formatter = _TS_FORMATTERS['iso']
+    return formatter()
 
 
 def generate_device_id(prefix: str = "iotkit") -> str:
@@ -44,8 +56,91 @@ def generate_device_id(prefix: str = "iotkit") -> str:
     Returns:
         str: Unique device ID
     """
-    unique_id = str(uuid.uuid4())[:8]
-    return f"{prefix}_{unique_id}"
+    # Four bytes of entropy hex-encoded gives the same 8-char suffix a
+    # sliced uuid4 did, without building and formatting a UUID object
+    return f"{prefix}_{os.urandom(4).hex()}"
+
+
+# Keys of which at least one must be present in a telemetry record;
+# built once instead of per validation call
+_REQUIRED_ANY = ('name', 'value', 'sensor', 'measurement')
+
+# Fields every sensor configuration must carry
+_REQUIRED_SENSOR = frozenset({'name'})
+
+
+# Upper day bound per month; February says 29 and the leap-year rule is
+# applied separately in _iso_fast_check
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _iso_offset_ok(s: str, i: int) -> bool:
+    """True when s[i:] is exactly a +HH:MM / -HH:MM UTC offset."""
+    return (s[i] in '+-' and s[i + 1:i + 3].isdigit() and s[i + 1:i + 3] <= '23'
+            and s[i + 3] == ':' and s[i + 4:i + 6].isdigit() and s[i + 4:i + 6] <= '59')
+
+
+def _iso_fast_check(s: str) -> bool:
+    """
+    Cheap structural check for common ISO-8601 timestamps.
+
+    True means the whole string is a valid timestamp and the full
+    parser can be skipped; shapes not fully covered here return False
+    and fall through to the slow path. Covers the shapes the kit
+    itself generates: fixed date/time separators, real month/day
+    ranges (leap years included), and an optional fraction (3 or 6
+    digits) and/or trailing Z or +-HH:MM offset.
+    """
+    n = len(s)
+    if n not in (19, 20, 24, 25, 26, 32):
+        return False
+    if not (s[4] == '-' and s[7] == '-' and s[10] in 'T '
+            and s[13] == ':' and s[16] == ':'):
+        return False
+    if not (s[:4].isdigit() and s[5:7].isdigit() and s[8:10].isdigit()
+            and s[11:13].isdigit() and s[14:16].isdigit() and s[17:19].isdigit()):
+        return False
+    if not ('01' <= s[5:7] <= '12' and s[11:13] <= '23'
+            and s[14:16] <= '59' and s[17:19] <= '59'):
+        return False
+
+    # Real day-of-month rules, not just <= 31
+    month = int(s[5:7])
+    day = int(s[8:10])
+    if day < 1 or day > _DAYS_IN_MONTH[month]:
+        return False
+    if month == 2 and day == 29:
+        year = int(s[:4])
+        if year % 4 != 0 or (year % 100 == 0 and year % 400 != 0):
+            return False
+
+    # The tail must match the one suffix shape allowed for its length
+    if n == 19:
+        return True
+    if n == 20:
+        return s[19] == 'Z'
+    if n == 24:
+        return s[19] == '.' and s[20:23].isdigit() and s[23] == 'Z'
+    if n == 25:
+        return _iso_offset_ok(s, 19)
+    if n == 26:
+        return s[19] == '.' and s[20:26].isdigit()
+    return s[19] == '.' and s[20:26].isdigit() and _iso_offset_ok(s, 26)
+
+
+def _check_timestamp(timestamp: Any) -> None:
+    """Validate one timestamp field, preferring the structural fast path."""
+    if not isinstance(timestamp, str):
+        raise ValueError("Timestamp must be a string")
+
+    if _iso_fast_check(timestamp):
+        return
+
+    # Odd shapes fall back to the real parser
+    try:
+        datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError("Invalid timestamp format. Use ISO 8601 format.")
 
 
 def validate_data(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,20 +160,12 @@ def validate_data(data: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("Data must be a dictionary")
     
     # Check for required fields (at least one of name or value should exist)
-    if not any(key in data for key in ['name', 'value', 'sensor', 'measurement']):
+    if not any(key in data for key in _REQUIRED_ANY):
         raise ValueError("Data must contain at least one of: name, value, sensor, measurement")
     
     # Validate timestamp format if present
     if 'timestamp' in data:
-        timestamp = data['timestamp']
-        if not isinstance(timestamp, str):
-            raise ValueError("Timestamp must be a string")
-        
-        # Try to parse as ISO format
-        try:
-            datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        except ValueError:
-            raise ValueError("Invalid timestamp format. Use ISO 8601 format.")
+        _check_timestamp(data['timestamp'])
     
     # Validate numeric values
     if 'value' in data:
@@ -92,10 +179,51 @@ def validate_data(data: Dict[str, Any]) -> Dict[str, Any]:
                 data['value'] = float(value)
             except ValueError:
                 pass  # Keep as string if not convertible
-    
+
     return data
 
 
+def validate_batch(data_list: list) -> list:
+    """
+    Validate a batch of IoT data records in one pass.
+
+    Single-loop alternative to calling validate_data() per record from
+    batch paths: the per-record checks are inlined so a homogeneous
+    batch pays one function call instead of one per row. Records are
+    normalized in place exactly as validate_data() does.
+
+    Args:
+        data_list (list): List of data dictionaries
+
+    Returns:
+        list: The validated list
+
+    Raises:
+        ValueError: If any record is invalid
+    """
+    for data in data_list:
+        if not isinstance(data, dict):
+            raise ValueError("Data must be a dictionary")
+
+        if not any(key in data for key in _REQUIRED_ANY):
+            raise ValueError("Data must contain at least one of: name, value, sensor, measurement")
+
+        if 'timestamp' in data:
+            _check_timestamp(data['timestamp'])
+
+        if 'value' in data:
+            value = data['value']
+            if not isinstance(value, (int, float, str)):
+                raise ValueError("Value must be numeric or string")
+            if isinstance(value, str):
+                try:
+                    data['value'] = float(value)
+                except ValueError:
+                    pass  # Keep as string if not convertible
+
+    return data_list
+
+
 def validate_sensor_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate sensor configuration.
@@ -109,10 +237,11 @@ def validate_sensor_config(config: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         ValueError: If configuration is invalid
     """
-    required_fields = ['name']
-    for field in required_fields:
-        if field not in config:
-            raise ValueError(f"Missing required field: {field}")
+    # One C-level set difference against the dict-keys view instead of
+    # a Python loop; stays O(1)-ish as required fields grow
+    missing = _REQUIRED_SENSOR - config.keys()
+    if missing:
+        raise ValueError(f"Missing required field: {next(iter(missing))}")
     
     # Validate name
     if not isinstance(config['name'], str) or not config['name'].strip():
@@ -137,6 +266,13 @@ def validate_sensor_config(config: Dict[str, Any]) -> Dict[str, Any]:
     return config
 
 
+# Pre-bound stdlib encoders for the no-orjson fallback: calling the
+# bound encode skips json.dumps' per-call keyword handling and its
+# cached-encoder branching
+_ENC_COMPACT = json.JSONEncoder(ensure_ascii=False, default=str).encode
+_ENC_PRETTY = json.JSONEncoder(ensure_ascii=False, indent=2, default=str).encode
+
+
 def encode_json(data: Any, pretty: bool = False) -> str:
     """
     Encode data to JSON string.
@@ -152,10 +288,10 @@ def encode_json(data: Any, pretty: bool = False) -> str:
         ValueError: If data cannot be encoded
     """
     try:
-        if pretty:
-            return json.dumps(data, indent=2, ensure_ascii=False, default=str)
-        else:
-            return json.dumps(data, ensure_ascii=False, default=str)
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(data, option=option, default=str).decode('utf-8')
+        return (_ENC_PRETTY if pretty else _ENC_COMPACT)(data)
     except Exception as e:
         raise ValueError(f"Failed to encode JSON: {str(e)}")
 
@@ -174,84 +310,130 @@ def decode_json(json_str: str) -> Any:
         ValueError: If JSON cannot be decoded
     """
     try:
+        if orjson is not None:
+            return orjson.loads(json_str)
         return json.loads(json_str)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         raise ValueError(f"Failed to decode JSON: {str(e)}")
 
 
+# Hostname characters permitted by validate_url; checked with one
+# linear pass instead of a regex
+_HOST_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz'
+                        'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                        '0123456789-._')
+
+
+@lru_cache(maxsize=1024)
+def _validate_url_cached(url: str) -> bool:
+    """Uncached structural URL check; see validate_url."""
+    if not url.startswith(('http://', 'https://')):
+        return False
+
+    try:
+        parts = urlsplit(url)
+        # .port raises ValueError on non-numeric or out-of-range ports
+        parts.port
+    except ValueError:
+        return False
+
+    hostname = parts.hostname
+    if not hostname:
+        return False
+
+    return all(c in _HOST_CHARS for c in hostname)
+
+
 def validate_url(url: str) -> bool:
     """
     Validate URL format.
-    
+
+    Structural check rather than a regex: scheme prefix, urlsplit, and
+    one pass over the hostname. Runs in linear time with no
+    backtracking, so crafted inputs cannot stall the validator. Results
+    are memoized — sinks revalidate the same handful of endpoint URLs
+    constantly, and str keys are immutable, so the cache is safe.
+
     Args:
         url (str): URL to validate
-    
+
     Returns:
         bool: True if URL is valid
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url))
+    if not isinstance(url, str):
+        return False
+
+    return _validate_url_cached(url)
+
+
+@lru_cache(maxsize=2048)
+def _validate_mqtt_topic_cached(topic: str) -> bool:
+    """Uncached topic check; see validate_mqtt_topic."""
+    # MQTT topic rules:
+    # - Cannot be empty
+    # - Cannot contain null character
+    # - Cannot start or end with /
+    # - + and # have special meaning (wildcards)
+
+    # Two O(1) edge-character compares (the caller guarantees a
+    # non-empty str), then one memchr-style sweep for the null byte —
+    # no method-call dispatch or extra scans.
+    # Basic validation - more complex rules exist but this covers basics
+    if topic[0] == '/' or topic[-1] == '/':
+        return False
+
+    return '\x00' not in topic
 
 
 def validate_mqtt_topic(topic: str) -> bool:
     """
     Validate MQTT topic format.
-    
+
+    Memoized: telemetry re-sends the same few topics thousands of
+    times, so repeat validations become one cache lookup. Safe because
+    str keys are immutable.
+
     Args:
         topic (str): MQTT topic to validate
-    
+
     Returns:
         bool: True if topic is valid
     """
     if not isinstance(topic, str) or not topic:
         return False
-    
-    # MQTT topic rules:
-    # - Cannot be empty
-    # - Cannot contain null character
-    # - Cannot start or end with /
-    # - + and # have special meaning (wildcards)
-    
-    if '\x00' in topic:
-        return False
-    
-    if topic.startswith('/') or topic.endswith('/'):
-        return False
-    
-    # Basic validation - more complex rules exist but this covers basics
-    return True
+
+    return _validate_mqtt_topic_cached(topic)
+
+
+# Maps characters invalid in Windows/Unix filenames to '_'; built once
+# so sanitize_filename is a single translate pass
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
 
 
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename by removing invalid characters.
-    
+
     Args:
         filename (str): Original filename
-    
+
     Returns:
         str: Sanitized filename
     """
-    # Remove invalid characters for Windows/Unix filenames
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Remove leading/trailing spaces and dots
-    filename = filename.strip(' .')
-    
+    # One C-level pass over the string instead of one replace() scan
+    # (and one new str) per invalid character
+    translated = filename.translate(_SANITIZE_TABLE)
+
+    # Trim spaces/dots by index so the only extra allocation is the
+    # final slice, not strip()'s intermediate string
+    i, j = 0, len(translated)
+    while i < j and translated[i] in ' .':
+        i += 1
+    while j > i and translated[j - 1] in ' .':
+        j -= 1
+
     # Ensure filename is not empty
-    if not filename:
-        filename = "unnamed_file"
-    
-    return filename
+    return translated[i:j] or "unnamed_file"
 
 
 def calculate_data_rate(data_count: int, time_seconds: float) -> float:
@@ -271,21 +453,26 @@ def calculate_data_rate(data_count: int, time_seconds: float) -> float:
     return data_count / time_seconds
 
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(bytes_count: int) -> str:
     """
     Format byte count into human-readable format.
-    
+
     Args:
         bytes_count (int): Number of bytes
-    
+
     Returns:
         str: Formatted byte string
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.1f} {unit}"
-        bytes_count /= 1024.0
-    return f"{bytes_count:.1f} PB"
+    if bytes_count <= 0:
+        return "0.0 B"
+
+    # bit_length picks the 1024-step unit directly — one integer op and
+    # one divide instead of a compare-and-divide loop
+    idx = min((int(bytes_count).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_count / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
 
 
 def setup_logging(level: str = "INFO", format_string: str = None) -> logging.Logger:
@@ -316,30 +503,35 @@ def setup_logging(level: str = "INFO", format_string: str = None) -> logging.Log
 def retry_operation(func: callable, max_retries: int = 3, delay: float = 1.0):
     """
     Retry decorator for unreliable operations.
-    
+
+    The happy path — success on the first call — pays one try/except
+    and no loop setup; the retry loop with linear backoff only runs
+    after an initial failure.
+
     Args:
         func (callable): Function to retry
         max_retries (int): Maximum number of retries
         delay (float): Delay between retries in seconds
-    
+
     Returns:
         callable: Decorated function
     """
-    import time
-    
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        last_exception = None
-        
-        for attempt in range(max_retries + 1):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            last_exception = e
+
+        for attempt in range(1, max_retries + 1):
+            time.sleep(delay * attempt)  # Linear backoff
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 last_exception = e
-                if attempt < max_retries:
-                    time.sleep(delay * (attempt + 1))  # Exponential backoff
-                else:
-                    raise last_exception
-    
+
+        raise last_exception
+
     return wrapper
 
 
@@ -356,7 +548,9 @@ class DataBuffer:
             max_size (int): Maximum buffer size
         """
         self.max_size = max_size
-        self.buffer = []
+        # Bounded in C by the deque itself: appends past capacity drop
+        # the oldest entry with no Python-level size check or realloc
+        self.buffer = deque(maxlen=max_size)
         self.logger = logging.getLogger("iotkit.utils.buffer")
     
     def add(self, data: Any) -> bool:
@@ -382,11 +576,33 @@ class DataBuffer:
         Returns:
             list: All buffered data
         """
-        data = self.buffer.copy()
+        data = list(self.buffer)
         if clear:
             self.buffer.clear()
         return data
     
+    def drain(self, n: int = None):
+        """
+        Yield buffered items oldest-first, removing each as it goes.
+
+        Streaming alternative to get_all(): no snapshot list is built,
+        and each item's memory is released as soon as the consumer moves
+        on — useful when flushing large buffers straight into a sink.
+        Items appended after the drain starts are left in the buffer.
+
+        Args:
+            n (int, optional): Maximum number of items to yield; drains
+                everything currently buffered when omitted
+
+        Yields:
+            Any: Buffered items in insertion order
+        """
+        buf = self.buffer
+        pop = buf.popleft
+        limit = len(buf) if n is None else min(n, len(buf))
+        for _ in range(limit):
+            yield pop()
+
     def is_full(self) -> bool:
         """Check if buffer is full."""
         return len(self.buffer) >= self.max_size
@@ -404,14 +620,27 @@ class DataBuffer:
         self.buffer.clear()
 
 
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> tuple:
+    """Split a dotted config key once; repeat lookups reuse the tuple."""
+    return tuple(key.split('.'))
+
+
 # Configuration management
 class Config:
     """
     Configuration manager for IoTKit.
     """
-    
+
+    __slots__ = ('config', '_cache', '_version')
+
     def __init__(self):
         """Initialize configuration."""
+        # Resolved-key cache stamped with a version; set() and
+        # load_from_file() bump the version so stale entries die. Safe
+        # as long as mutation goes through those methods.
+        self._cache = {}
+        self._version = 0
         self.config = {
             'mqtt': {
                 'default_port': 1883,
@@ -447,16 +676,51 @@ class Config:
         Returns:
             Any: Configuration value
         """
-        keys = key.split('.')
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
         value = self.config
         
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
                 return default
         
+        self._cache[key] = (self._version, value)
         return value
+
+    def bind(self, key: str, default=None):
+        """
+        Precompile a getter closure for a frequently read key.
+
+        The dotted key is split once here; callers in per-message loops
+        stash the returned zero-argument callable and invoke it instead
+        of paying get()'s split and method dispatch every time. The
+        closure reads through self.config, so later set() calls are
+        visible.
+
+        Args:
+            key (str): Configuration key (dot notation supported)
+            default: Value returned when the key is missing
+
+        Returns:
+            callable: Zero-argument getter for the key
+        """
+        keys = _split_key(key)
+        config = self.config
+
+        def getter():
+            value = config
+            for k in keys:
+                if isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    return default
+            return value
+
+        return getter
     
     def set(self, key: str, value: Any):
         """
@@ -466,7 +730,7 @@ class Config:
             key (str): Configuration key (dot notation supported)
             value: Value to set
         """
-        keys = key.split('.')
+        keys = _split_key(key)
         config = self.config
         
         for k in keys[:-1]:
@@ -475,6 +739,8 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
+        self._version += 1
+        self._cache.clear()
     
     def load_from_file(self, filepath: str):
         """
@@ -484,9 +750,17 @@ class Config:
             filepath (str): Path to configuration file
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                file_config = json.load(f)
-                self.config.update(file_config)
+            # Read bytes and hand them straight to the parser; orjson
+            # works on the raw buffer without a separate utf-8 decode pass
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            if orjson is not None:
+                file_config = orjson.loads(raw)
+            else:
+                file_config = json.loads(raw)
+            self.config.update(file_config)
+            self._version += 1
+            self._cache.clear()
         except Exception as e:
             raise ValueError(f"Failed to load config from {filepath}: {str(e)}")
     
@@ -498,8 +772,12 @@ class Config:
             filepath (str): Path to save configuration
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2, ensure_ascii=False)
         except Exception as e:
             raise ValueError(f"Failed to save config to {filepath}: {str(e)}")
 
@@ -5,11 +5,12 @@ This module provides WebSocket client and server functionality for real-time IoT
 """
 
 import json
+import zlib
 import asyncio
 import threading
 import logging
 import time
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, Set
 from datetime import datetime
 
 try:
@@ -19,8 +20,57 @@ try:
 except ImportError:
     raise ImportError("websockets is required. Install with: pip install websockets")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# uvloop is optional but recommended when handling more than ~1k
+# concurrent connections; the stdlib selector loop is used otherwise
+try:
+    import uvloop
+    _loop_factory = uvloop.new_event_loop
+except ImportError:
+    _loop_factory = asyncio.new_event_loop
+
 from .utils import validate_data, generate_timestamp
 
+# Timestamp cache for high-rate bridge relays: messages arriving within
+# the same millisecond share one formatted value instead of paying a
+# clock read plus ISO formatting each
+_TS_CACHE = (0.0, "", b"")
+
+
+def _cached_timestamp() -> tuple:
+    """
+    Return (str, bytes) forms of the current timestamp, at most 1 ms stale.
+
+    Returns:
+        tuple: (monotonic time, timestamp string, timestamp bytes)
+    """
+    global _TS_CACHE
+    now = time.monotonic()
+    cached = _TS_CACHE
+    if now - cached[0] > 0.001:
+        ts = generate_timestamp()
+        cached = (now, ts, ts.encode("ascii"))
+        _TS_CACHE = cached
+    return cached
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
 
 class WebSocketPublisher:
     """
@@ -28,7 +78,9 @@ class WebSocketPublisher:
     """
     
     def __init__(self, uri: str, headers: Optional[Dict[str, str]] = None,
-                 auto_reconnect: bool = True, reconnect_interval: int = 5):
+                 auto_reconnect: bool = True, reconnect_interval: int = 5,
+                 on_send_error: Optional[Callable] = None,
+                 schema: Optional[type] = None):
         """
         Initialize WebSocket Publisher.
         
@@ -37,11 +89,31 @@ class WebSocketPublisher:
             headers (dict, optional): Additional headers for connection
             auto_reconnect (bool): Auto-reconnect on connection loss
             reconnect_interval (int): Seconds between reconnection attempts
+            on_send_error (callable, optional): Called with (exception,
+                batch) from the writer when an asynchronous send fails;
+                send() itself never blocks on delivery
+            schema (type, optional): msgspec.Struct type describing the
+                messages; when given and msgspec is installed, each
+                message is validated and serialized in one C pass
+                instead of validate_data + dumps. Ignored without
+                msgspec.
         """
         self.uri = uri
         self.headers = headers or {}
         self.auto_reconnect = auto_reconnect
         self.reconnect_interval = reconnect_interval
+        self.on_send_error = on_send_error
+        # Per-message validate+encode, specialized once at construction
+        if schema is not None and msgspec is not None:
+            _encode = msgspec.json.encode
+            _convert = msgspec.convert
+
+            def _prepare(data):
+                return _encode(_convert(data, type=schema))
+        else:
+            def _prepare(data):
+                return _dumps(validate_data(data))
+        self._prepare = _prepare
         
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.connected = False
@@ -52,6 +124,18 @@ class WebSocketPublisher:
         self.loop = None
         self.thread = None
         self._stop_event = threading.Event()
+        # Loop-local stop signal (created on the loop in _run_loop);
+        # awaiting it is cheaper than re-checking the threading.Event
+        self._stop_aevent: Optional[asyncio.Event] = None
+        # Set from the loop thread on first successful connect so
+        # start() can return as soon as the connection is up
+        self._ready = threading.Event()
+
+        # Outbound queue, created on the loop thread in _run_loop; one
+        # writer coroutine drains it and coalesces bursts into single
+        # frames
+        self._out_queue: Optional[asyncio.Queue] = None
+        self._writer_task = None
     
     async def _connect(self) -> bool:
         """
@@ -61,92 +145,176 @@ class WebSocketPublisher:
             bool: True if connected successfully
         """
         try:
+            # permessage-deflate off: for the small payloads this library
+            # sends, compression CPU outweighs the wire savings
+            # Library keepalives replace the old manual ping loop:
+            # pings go out only when the connection is idle
             self.websocket = await websockets.connect(
                 self.uri,
-                extra_headers=self.headers
+                extra_headers=self.headers,
+                compression=None,
+                write_limit=2 ** 20,
+                ping_interval=20,
+                ping_timeout=20
             )
             self.connected = True
+            self._ready.set()
             self.logger.info(f"Connected to WebSocket server: {self.uri}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to connect to {self.uri}: {str(e)}")
             self.connected = False
             return False
-    
+
     async def _disconnect(self):
         """Disconnect from WebSocket server."""
         if self.websocket and not self.websocket.closed:
             await self.websocket.close()
             self.connected = False
             self.logger.info("Disconnected from WebSocket server")
-    
-    async def _send_data(self, data: Dict[str, Any]) -> bool:
+
+    async def _writer_loop(self):
         """
-        Send data through WebSocket.
-        
-        Args:
-            data (dict): Data to send
-        
-        Returns:
-            bool: True if sent successfully
+        Drain queued messages and coalesce each burst into one frame.
+
+        Everything waiting in the queue when the writer wakes is sent as
+        a single JSON array frame, so a burst of N queued messages costs
+        one websocket.send (one frame header, one event-loop write)
+        instead of N.
         """
-        if not self.connected or not self.websocket:
-            return False
-        
-        try:
-            validated_data = validate_data(data)
-            message = json.dumps(validated_data)
-            await self.websocket.send(message)
-            self.logger.debug(f"Sent WebSocket message: {message}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to send WebSocket message: {str(e)}")
-            self.connected = False
-            return False
-    
+        queue = self._out_queue
+        while True:
+            batch = [await queue.get()]
+            while True:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                raw = []
+                encoded = []
+                prepare = self._prepare
+                for data in batch:
+                    # Pre-serialized frames from send_raw() pass through
+                    # untouched
+                    if isinstance(data, (bytes, str)):
+                        raw.append(data)
+                        continue
+                    try:
+                        encoded.append(prepare(data))
+                    except Exception as e:
+                        self.logger.error(f"Dropping invalid message: {str(e)}")
+
+                if (raw or encoded) and self.connected and self.websocket:
+                    for frame in raw:
+                        await self.websocket.send(frame)
+                    if encoded:
+                        if len(encoded) == 1:
+                            payload = encoded[0]
+                        else:
+                            payload = b"[" + b",".join(encoded) + b"]"
+                        await self.websocket.send(payload)
+                    self.logger.debug("Sent %d queued message(s)", len(raw) + len(encoded))
+            except Exception as e:
+                self.logger.error(f"Failed to send queued messages: {str(e)}")
+                self.connected = False
+                if self.on_send_error is not None:
+                    try:
+                        self.on_send_error(e, batch)
+                    except Exception as cb_err:
+                        self.logger.error(f"Error in send-error callback: {str(cb_err)}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _enqueue_many(self, data_list: list):
+        """Enqueue a burst on the writer queue; runs on the loop thread."""
+        put = self._out_queue.put_nowait
+        for data in data_list:
+            put(data)
+
     async def _run_loop(self):
         """Main event loop for WebSocket connection."""
-        while self.running and not self._stop_event.is_set():
+        self._stop_aevent = asyncio.Event()
+        self._out_queue = asyncio.Queue(maxsize=10000)
+        self._writer_task = asyncio.ensure_future(self._writer_loop())
+        try:
+            await self._connection_loop()
+        finally:
+            self._writer_task.cancel()
+
+    async def _connection_loop(self):
+        """Connect/reconnect cycle; runs until stopped."""
+        stop_event = self._stop_aevent
+        while self.running and not stop_event.is_set():
             if not self.connected:
-                if await self._connect():
-                    continue
-                else:
+                if not await self._connect():
                     if self.auto_reconnect:
                         self.logger.info(f"Retrying connection in {self.reconnect_interval}s...")
-                        await asyncio.sleep(self.reconnect_interval)
-                        continue
+                        try:
+                            await asyncio.wait_for(stop_event.wait(),
+                                                   timeout=self.reconnect_interval)
+                            break
+                        except asyncio.TimeoutError:
+                            continue
                     else:
                         break
             
             try:
-                # Keep connection alive with ping
-                if self.websocket:
-                    await self.websocket.ping()
-                    await asyncio.sleep(1)
+                # No periodic tick: park until either the socket closes
+                # (transport keepalives monitor it) or stop() is called
+                stop_task = asyncio.ensure_future(stop_event.wait())
+                closed_task = asyncio.ensure_future(self.websocket.wait_closed())
+                done, pending = await asyncio.wait(
+                    {stop_task, closed_task},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in pending:
+                    task.cancel()
+                if stop_task in done:
+                    break
+                self.connected = False
             except Exception as e:
                 self.logger.error(f"Connection error: {str(e)}")
                 self.connected = False
-                if not self.auto_reconnect:
-                    break
+            
+            if not self.auto_reconnect:
+                break
     
-    def start(self):
-        """Start WebSocket publisher in background thread."""
+    def start(self, loop=None):
+        """
+        Start WebSocket publisher.
+
+        Args:
+            loop (asyncio.AbstractEventLoop, optional): Existing running
+                loop to schedule the publisher on. When given, no
+                dedicated thread is created; multiple endpoints can
+                share one loop. When omitted, a background thread with
+                its own loop is started.
+        """
         if self.running:
             return
         
         self.running = True
         self._stop_event.clear()
+        self._ready.clear()
         
-        def run_async():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self._run_loop())
-        
-        self.thread = threading.Thread(target=run_async, daemon=True)
-        self.thread.start()
+        if loop is not None:
+            self.loop = loop
+            asyncio.run_coroutine_threadsafe(self._run_loop(), loop)
+        else:
+            def run_async():
+                self.loop = _loop_factory()
+                asyncio.set_event_loop(self.loop)
+                self.loop.run_until_complete(self._run_loop())
+            
+            self.thread = threading.Thread(target=run_async, daemon=True)
+            self.thread.start()
         
-        # Wait a moment for connection
-        time.sleep(1)
+        # Block only until the connection is actually up (or the first
+        # retry window elapses), not a fixed second
+        self._ready.wait(timeout=self.reconnect_interval + 1)
     
     def stop(self):
         """Stop WebSocket publisher."""
@@ -154,6 +322,8 @@ class WebSocketPublisher:
         self._stop_event.set()
         
         if self.loop and not self.loop.is_closed():
+            if self._stop_aevent is not None:
+                self.loop.call_soon_threadsafe(self._stop_aevent.set)
             asyncio.run_coroutine_threadsafe(self._disconnect(), self.loop)
         
         if self.thread and self.thread.is_alive():
@@ -161,24 +331,101 @@ class WebSocketPublisher:
     
     def send(self, data: Dict[str, Any]) -> bool:
         """
-        Send data through WebSocket (thread-safe).
+        Queue data for sending through WebSocket (thread-safe).
+
+        Non-blocking: the message is handed to the writer coroutine,
+        which coalesces queued bursts into single frames. True means the
+        message was queued, not that it has been delivered.
         
         Args:
             data (dict): Data to send
         
         Returns:
-            bool: True if sent successfully
+            bool: True if the message was queued
         """
-        if not self.running or not self.loop:
+        if not self.running or not self.loop or self._out_queue is None:
             return False
         
         try:
-            future = asyncio.run_coroutine_threadsafe(self._send_data(data), self.loop)
-            return future.result(timeout=5)
+            self.loop.call_soon_threadsafe(self._out_queue.put_nowait, data)
+            return True
         except Exception as e:
             self.logger.error(f"Failed to send data: {str(e)}")
             return False
     
+    def send_raw(self, payload: bytes) -> bool:
+        """
+        Queue a pre-serialized frame for sending (thread-safe).
+
+        Skips validation and encoding; the bytes are sent as one frame
+        exactly as given. Lets fan-out callers serialize a shared
+        payload once instead of once per publisher.
+
+        Args:
+            payload (bytes): Frame to send
+
+        Returns:
+            bool: True if the frame was queued
+        """
+        if not self.running or not self.loop or self._out_queue is None:
+            return False
+        
+        try:
+            self.loop.call_soon_threadsafe(self._out_queue.put_nowait, payload)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to send raw frame: {str(e)}")
+            return False
+
+    def flush(self, timeout: float = 5) -> bool:
+        """
+        Block until every queued message has been handed to the socket.
+
+        Delivery barrier for the non-blocking send() path: waits for the
+        writer coroutine to work through the outbound queue.
+
+        Args:
+            timeout (float): Seconds to wait before giving up
+
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        if not self.running or not self.loop or self._out_queue is None:
+            return True
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._out_queue.join(), self.loop)
+            future.result(timeout=timeout)
+            return True
+        except Exception as e:
+            self.logger.error(f"Flush failed: {str(e)}")
+            return False
+
+    def send_many(self, data_list: list) -> int:
+        """
+        Queue multiple messages with a single thread-to-loop handoff (thread-safe).
+
+        The whole burst crosses to the event loop in one
+        call_soon_threadsafe; the writer coroutine coalesces it into a
+        single frame. Non-blocking: the return value counts messages
+        queued, not delivered — use flush() for a delivery barrier.
+
+        Args:
+            data_list (list): List of data dictionaries to send
+
+        Returns:
+            int: Number of messages queued
+        """
+        if not self.running or not self.loop or self._out_queue is None:
+            return 0
+
+        try:
+            self.loop.call_soon_threadsafe(self._enqueue_many, list(data_list))
+            return len(data_list)
+        except Exception as e:
+            self.logger.error(f"Failed to send batch: {str(e)}")
+            return 0
+
     def is_connected(self) -> bool:
         """Check if WebSocket is connected."""
         return self.connected
@@ -191,7 +438,8 @@ class WebSocketSubscriber:
     
     def __init__(self, uri: str, on_message: Optional[Callable] = None,
                  headers: Optional[Dict[str, str]] = None,
-                 auto_reconnect: bool = True, reconnect_interval: int = 5):
+                 auto_reconnect: bool = True, reconnect_interval: int = 5,
+                 max_inflight: int = 64, executor=None):
         """
         Initialize WebSocket Subscriber.
         
@@ -201,12 +449,18 @@ class WebSocketSubscriber:
             headers (dict, optional): Additional headers for connection
             auto_reconnect (bool): Auto-reconnect on connection loss
             reconnect_interval (int): Seconds between reconnection attempts
+            max_inflight (int): Maximum messages being processed
+                concurrently before the read loop waits
+            executor (Executor, optional): Executor for synchronous
+                callbacks; the loop's default thread pool when omitted
         """
         self.uri = uri
         self.on_message_callback = on_message
         self.headers = headers or {}
         self.auto_reconnect = auto_reconnect
         self.reconnect_interval = reconnect_interval
+        self.max_inflight = max_inflight
+        self._executor = executor
         
         self.websocket: Optional[WebSocketClientProtocol] = None
         self.connected = False
@@ -216,6 +470,10 @@ class WebSocketSubscriber:
         self.loop = None
         self.thread = None
         self._stop_event = threading.Event()
+        # Loop-local stop signal, created on the loop in _run_loop
+        self._stop_aevent: Optional[asyncio.Event] = None
+        # Bounds concurrently processing callbacks, created on the loop
+        self._inflight: Optional[asyncio.Semaphore] = None
     
     async def _connect(self) -> bool:
         """Connect to WebSocket server."""
@@ -239,6 +497,39 @@ class WebSocketSubscriber:
             self.connected = False
             self.logger.info("Disconnected from WebSocket server")
     
+    async def _dispatch(self, data: Dict[str, Any]):
+        """
+        Hand one decoded message to the callback without blocking reads.
+
+        Coroutine callbacks run as tasks; synchronous callbacks run on
+        the executor. The in-flight semaphore caps how many are being
+        processed at once so a slow consumer backpressures the read
+        loop instead of queueing unbounded work.
+
+        Args:
+            data (dict): Decoded message
+        """
+        callback = self.on_message_callback
+        await self._inflight.acquire()
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                future = asyncio.ensure_future(callback(data))
+            else:
+                future = asyncio.get_event_loop().run_in_executor(
+                    self._executor, callback, data)
+            future.add_done_callback(self._dispatch_done)
+        except Exception:
+            self._inflight.release()
+            raise
+
+    def _dispatch_done(self, future):
+        """Release the in-flight slot and surface callback errors."""
+        self._inflight.release()
+        if not future.cancelled():
+            exc = future.exception()
+            if exc is not None:
+                self.logger.error(f"Error processing message: {str(exc)}")
+
     async def _listen_for_messages(self):
         """Listen for incoming WebSocket messages."""
         if not self.websocket:
@@ -247,13 +538,26 @@ class WebSocketSubscriber:
         try:
             async for message in self.websocket:
                 try:
-                    data = json.loads(message)
-                    self.logger.debug(f"Received WebSocket message: {data}")
+                    if isinstance(message, bytes) and message[:1] == b"\x78":
+                        # zlib-compressed broadcast from WebSocketServer
+                        message = zlib.decompress(message)
+                    data = _loads(message)
+                    # Lazy formatting: the payload is only stringified
+                    # when DEBUG is actually enabled
+                    self.logger.debug("Received WebSocket message: %s", data)
                     
                     if self.on_message_callback:
-                        self.on_message_callback(data)
+                        # Processing happens off the read loop so the
+                        # socket keeps draining while callbacks run.
+                        # Coalesced frames carry a top-level array;
+                        # unwrap so the callback always gets one dict
+                        if isinstance(data, list):
+                            for item in data:
+                                await self._dispatch(item)
+                        else:
+                            await self._dispatch(data)
                         
-                except json.JSONDecodeError:
+                except ValueError:
                     self.logger.warning(f"Received non-JSON message: {message}")
                 except Exception as e:
                     self.logger.error(f"Error processing message: {str(e)}")
@@ -263,7 +567,10 @@ class WebSocketSubscriber:
     
     async def _run_loop(self):
         """Main event loop for WebSocket subscriber."""
-        while self.running and not self._stop_event.is_set():
+        self._stop_aevent = asyncio.Event()
+        self._inflight = asyncio.Semaphore(self.max_inflight)
+        stop_event = self._stop_aevent
+        while self.running and not stop_event.is_set():
             if not self.connected:
                 if await self._connect():
                     # Start listening for messages
@@ -271,23 +578,39 @@ class WebSocketSubscriber:
                 else:
                     if self.auto_reconnect:
                         self.logger.info(f"Retrying connection in {self.reconnect_interval}s...")
-                        await asyncio.sleep(self.reconnect_interval)
-                        continue
+                        try:
+                            await asyncio.wait_for(stop_event.wait(),
+                                                   timeout=self.reconnect_interval)
+                            break
+                        except asyncio.TimeoutError:
+                            continue
                     else:
                         break
             
             await asyncio.sleep(0.1)
     
-    def start(self):
-        """Start WebSocket subscriber in background thread."""
+    def start(self, loop=None):
+        """
+        Start WebSocket subscriber.
+
+        Args:
+            loop (asyncio.AbstractEventLoop, optional): Existing running
+                loop to schedule the subscriber on instead of creating a
+                dedicated background thread.
+        """
         if self.running:
             return
         
         self.running = True
         self._stop_event.clear()
         
+        if loop is not None:
+            self.loop = loop
+            asyncio.run_coroutine_threadsafe(self._run_loop(), loop)
+            return
+        
         def run_async():
-            self.loop = asyncio.new_event_loop()
+            self.loop = _loop_factory()
             asyncio.set_event_loop(self.loop)
             self.loop.run_until_complete(self._run_loop())
         
@@ -300,6 +623,8 @@ class WebSocketSubscriber:
         self._stop_event.set()
         
         if self.loop and not self.loop.is_closed():
+            if self._stop_aevent is not None:
+                self.loop.call_soon_threadsafe(self._stop_aevent.set)
             asyncio.run_coroutine_threadsafe(self._disconnect(), self.loop)
         
         if self.thread and self.thread.is_alive():
@@ -319,6 +644,13 @@ class WebSocketSubscriber:
         return self.connected
 
 
+# Per-client outbound queue bounds: a full queue puts the client in
+# degraded mode (old frames shed, latest kept); it recovers once the
+# writer drains the backlog below the exit threshold
+_BACKPRESSURE_ENTER = 1024
+_BACKPRESSURE_EXIT = 256
+
+
 class WebSocketServer:
     """
     WebSocket Server for receiving IoT data from WebSocket clients.
@@ -327,7 +659,8 @@ class WebSocketServer:
     def __init__(self, host: str = "localhost", port: int = 8765,
                  on_message: Optional[Callable] = None,
                  on_connect: Optional[Callable] = None,
-                 on_disconnect: Optional[Callable] = None):
+                 on_disconnect: Optional[Callable] = None,
+                 compress: bool = False):
         """
         Initialize WebSocket Server.
         
@@ -337,16 +670,25 @@ class WebSocketServer:
             on_message (callable, optional): Callback for received messages
             on_connect (callable, optional): Callback for client connections
             on_disconnect (callable, optional): Callback for client disconnections
+            compress (bool): Compress each broadcast payload once with
+                zlib and fan out the compressed binary frame, instead of
+                letting permessage-deflate recompress per client.
+                WebSocketSubscriber decompresses transparently.
         """
         self.host = host
         self.port = port
+        self.compress = compress
         self.on_message_callback = on_message
         self.on_connect_callback = on_connect
         self.on_disconnect_callback = on_disconnect
         
         self.server = None
         self.running = False
-        self.clients: List[WebSocketServerProtocol] = []
+        # Set from the loop thread once the listener is bound
+        self._ready = threading.Event()
+        # Set, not list: membership checks and removals are O(1),
+        # which matters when disconnects arrive under high fan-out
+        self.clients: Set[WebSocketServerProtocol] = set()
         self.logger = logging.getLogger(f"iotkit.websocket.server.{host}:{port}")
         
         self.loop = None
@@ -363,8 +705,14 @@ class WebSocketServer:
         client_address = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
         self.logger.info(f"Client connected: {client_address}")
         
-        # Add to clients list
-        self.clients.append(websocket)
+        # Per-client outbound queue drained by a dedicated writer task:
+        # broadcasts just enqueue, so one slow peer cannot stall the rest
+        websocket._out_q = asyncio.Queue(maxsize=_BACKPRESSURE_ENTER)
+        websocket._degraded = False
+        writer = asyncio.ensure_future(self._client_writer(websocket, client_address))
+
+        # Add to clients set
+        self.clients.add(websocket)
         
         # Call connect callback
         if self.on_connect_callback:
@@ -376,13 +724,19 @@ class WebSocketServer:
         try:
             async for message in websocket:
                 try:
-                    data = json.loads(message)
-                    self.logger.debug(f"Received from {client_address}: {data}")
+                    data = _loads(message)
+                    self.logger.debug("Received from %s: %s", client_address, data)
                     
                     if self.on_message_callback:
-                        self.on_message_callback(websocket, data, client_address)
+                        # Publishers coalesce bursts into array frames;
+                        # unwrap so the callback always gets one dict
+                        if isinstance(data, list):
+                            for item in data:
+                                self.on_message_callback(websocket, item, client_address)
+                        else:
+                            self.on_message_callback(websocket, data, client_address)
                         
-                except json.JSONDecodeError:
+                except ValueError:
                     self.logger.warning(f"Received non-JSON message from {client_address}: {message}")
                 except Exception as e:
                     self.logger.error(f"Error processing message from {client_address}: {str(e)}")
@@ -391,9 +745,10 @@ class WebSocketServer:
             self.logger.error(f"Error handling client {client_address}: {str(e)}")
         
         finally:
-            # Remove from clients list
-            if websocket in self.clients:
-                self.clients.remove(websocket)
+            writer.cancel()
+
+            # Remove from clients set
+            self.clients.discard(websocket)
             
             # Call disconnect callback
             if self.on_disconnect_callback:
@@ -404,14 +759,48 @@ class WebSocketServer:
             
             self.logger.info(f"Client disconnected: {client_address}")
     
+    async def _client_writer(self, websocket: WebSocketServerProtocol, client_address: str):
+        """
+        Drain one client's outbound queue onto its socket.
+
+        Args:
+            websocket: WebSocket connection owning the queue
+            client_address: Client address for log messages
+        """
+        queue = websocket._out_q
+        try:
+            while True:
+                payload = await queue.get()
+                try:
+                    await websocket.send(payload)
+                finally:
+                    queue.task_done()
+                if websocket._degraded and queue.qsize() < _BACKPRESSURE_EXIT:
+                    # Backlog drained: tell the client frames were shed
+                    # while it was behind
+                    websocket._degraded = False
+                    await websocket.send(json.dumps({"$backpressure": True}))
+                    self.logger.info(f"Client {client_address} recovered from backpressure")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.warning(f"Dropping client {client_address}: {str(e)}")
+            self.clients.discard(websocket)
+
     async def _start_server(self):
         """Start the WebSocket server."""
         try:
+            # permessage-deflate would recompress the same broadcast
+            # once per client; compression happens once in
+            # _broadcast_data instead (when enabled)
             self.server = await websockets.serve(
                 self._handle_client,
                 self.host,
-                self.port
+                self.port,
+                compression=None,
+                write_limit=2 ** 20
             )
+            self._ready.set()
             self.logger.info(f"WebSocket server started on {self.host}:{self.port}")
             
             # Keep server running
@@ -426,17 +815,18 @@ class WebSocketServer:
             return
         
         self.running = True
+        self._ready.clear()
         
         def run_async():
-            self.loop = asyncio.new_event_loop()
+            self.loop = _loop_factory()
             asyncio.set_event_loop(self.loop)
             self.loop.run_until_complete(self._start_server())
         
         self.thread = threading.Thread(target=run_async, daemon=True)
         self.thread.start()
         
-        # Wait a moment for server to start
-        time.sleep(1)
+        # Block only until the listener is bound, not a fixed second
+        self._ready.wait(timeout=5)
     
     def stop(self):
         """Stop WebSocket server."""
@@ -448,10 +838,14 @@ class WebSocketServer:
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=5)
     
-    async def _broadcast_data(self, data: Dict[str, Any]):
+    def _broadcast_sync(self, data: Dict[str, Any]):
         """
-        Broadcast data to all connected clients.
-        
+        Encode data once and enqueue it on every client's writer queue.
+
+        Runs on the event-loop thread but never awaits: fan-out is a
+        put_nowait per client, so broadcasting costs no Task creation
+        and a stalled peer only fills its own queue.
+
         Args:
             data (dict): Data to broadcast
         """
@@ -459,23 +853,44 @@ class WebSocketServer:
             return
         
         try:
+            # Encode once, then hand the same bytes object to every
+            # client; the protocol skips its per-send UTF-8 encode of
+            # str payloads
             validated_data = validate_data(data)
-            message = json.dumps(validated_data)
-            
-            # Send to all connected clients
-            disconnected = []
-            for client in self.clients:
+            self._fanout(_dumps(validated_data))
+        except Exception as e:
+            self.logger.error(f"Broadcast error: {str(e)}")
+
+    def _fanout(self, payload: bytes):
+        """
+        Enqueue one encoded payload on every client's writer queue.
+
+        Args:
+            payload (bytes): Encoded frame shared by all clients
+        """
+        try:
+            if self.compress:
+                # Compress once for the whole fan-out; every client
+                # receives the same binary frame
+                payload = zlib.compress(payload, 6)
+
+            for client in list(self.clients):
+                queue = client._out_q
                 try:
-                    await client.send(message)
-                except Exception as e:
-                    self.logger.warning(f"Failed to send to client: {str(e)}")
-                    disconnected.append(client)
-            
-            # Remove disconnected clients
-            for client in disconnected:
-                if client in self.clients:
-                    self.clients.remove(client)
-                    
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    # Shed the oldest queued frame so the slow client
+                    # always converges on the latest value
+                    if not client._degraded:
+                        client._degraded = True
+                        self.logger.warning("Client queue full, shedding old frames")
+                    try:
+                        queue.get_nowait()
+                        queue.task_done()
+                        queue.put_nowait(payload)
+                    except (asyncio.QueueEmpty, asyncio.QueueFull):
+                        pass
+
         except Exception as e:
             self.logger.error(f"Broadcast error: {str(e)}")
     
@@ -493,12 +908,35 @@ class WebSocketServer:
             return False
         
         try:
-            asyncio.run_coroutine_threadsafe(self._broadcast_data(data), self.loop)
+            self.loop.call_soon_threadsafe(self._broadcast_sync, data)
             return True
         except Exception as e:
             self.logger.error(f"Failed to broadcast data: {str(e)}")
             return False
     
+    def broadcast_raw(self, payload: bytes) -> bool:
+        """
+        Broadcast a pre-serialized frame to all clients (thread-safe).
+
+        Skips validation and encoding; callers that already hold the
+        encoded bytes fan them out directly.
+
+        Args:
+            payload (bytes): Encoded frame to broadcast
+
+        Returns:
+            bool: True if broadcast was attempted
+        """
+        if not self.running or not self.loop:
+            return False
+        
+        try:
+            self.loop.call_soon_threadsafe(self._fanout, payload)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to broadcast raw frame: {str(e)}")
+            return False
+    
     def get_connected_clients_count(self) -> int:
         """Get number of connected clients."""
         return len(self.clients)
@@ -532,6 +970,9 @@ class WebSocketBridge:
         self.publishers: Dict[str, WebSocketPublisher] = {}
         self.subscribers: Dict[str, WebSocketSubscriber] = {}
         self.logger = logging.getLogger("iotkit.websocket.bridge")
+        # Shared event loop (the server's) that all bridge endpoints run
+        # on once the bridge has started, instead of one thread each
+        self._loop = None
         
         # Set server callbacks
         self.server.set_message_callback(self._handle_server_message)
@@ -540,20 +981,33 @@ class WebSocketBridge:
     
     def _handle_server_message(self, websocket, data: Dict[str, Any], client_address: str):
         """Handle messages from WebSocket server clients."""
-        self.logger.info(f"Bridge received message from {client_address}: {data}")
+        self.logger.info("Bridge received message from %s: %s", client_address, data)
         
         # Add timestamp and source
         bridge_data = {
             "source": "websocket_client",
             "client_address": client_address,
-            "bridge_timestamp": generate_timestamp(),
+            "bridge_timestamp": _cached_timestamp()[1],
             "data": data
         }
         
-        # Broadcast to all publishers
+        # Serialize the envelope once and share the same bytes with
+        # every publisher instead of validating and encoding per fan-out
+        payload = _dumps(bridge_data)
         for name, publisher in self.publishers.items():
-            if publisher.is_connected():
-                publisher.send(bridge_data)
+            if not publisher.is_connected():
+                continue
+            queue = publisher._out_queue
+            if publisher.loop is self._loop and queue is not None:
+                # This callback already runs on the shared loop, so the
+                # frame goes straight onto the writer queue — no
+                # call_soon_threadsafe hop per publisher
+                try:
+                    queue.put_nowait(payload)
+                except asyncio.QueueFull:
+                    self.logger.warning("Publisher '%s' queue full, dropping bridge message", name)
+            else:
+                publisher.send_raw(payload)
     
     def _handle_client_connect(self, websocket, client_address: str):
         """Handle client connections."""
@@ -573,7 +1027,7 @@ class WebSocketBridge:
         """
         publisher = WebSocketPublisher(uri)
         self.publishers[name] = publisher
-        publisher.start()
+        publisher.start(loop=self._loop)
         self.logger.info(f"Added WebSocket publisher '{name}': {uri}")
     
     def add_subscriber(self, name: str, uri: str, callback: Optional[Callable] = None):
@@ -585,24 +1039,33 @@ class WebSocketBridge:
             uri (str): WebSocket URI to connect to
             callback (callable, optional): Message callback
         """
+        # The envelope is constant except for timestamp and data, so
+        # the fixed JSON fragments are encoded once per subscriber and
+        # each message is a bytes concatenation instead of a dict build
+        # plus full dumps
+        prefix = (b'{"source":"websocket_subscriber","subscriber_name":"'
+                  + name.encode("utf-8") + b'","bridge_timestamp":"')
+        middle = b'","data":'
+
         def default_callback(data):
-            self.logger.info(f"Subscriber '{name}' received: {data}")
+            self.logger.info("Subscriber '%s' received: %s", name, data)
             # Broadcast to server clients
-            self.server.broadcast({
-                "source": "websocket_subscriber",
-                "subscriber_name": name,
-                "bridge_timestamp": generate_timestamp(),
-                "data": data
-            })
+            payload = (prefix + _cached_timestamp()[2]
+                       + middle + _dumps(data) + b"}")
+            self.server.broadcast_raw(payload)
         
         subscriber = WebSocketSubscriber(uri, callback or default_callback)
         self.subscribers[name] = subscriber
-        subscriber.start()
+        subscriber.start(loop=self._loop)
         self.logger.info(f"Added WebSocket subscriber '{name}': {uri}")
     
     def start(self):
         """Start the WebSocket bridge."""
         self.server.start()
+        # Endpoints added from here on share the server's loop; with N
+        # publishers and M subscribers the bridge runs one thread, not
+        # N+M+1
+        self._loop = self.server.loop
         self.logger.info("WebSocket bridge started")
     
     def stop(self):